@@ -148,14 +148,18 @@ class StabilityMonitor:
             # Normal - no adjustment
             return 1.0
     
-    def generate_alert(self) -> Dict[str, Any]:
+    def generate_alert(self, result: Dict[str, Any] = None) -> Dict[str, Any]:
         """
         Generate stability alert if needed
         
+        Args:
+            result: Precomputed calculate_stability_score() output (optional)
+        
         Returns:
             Alert dict or None
         """
-        result = self.calculate_stability_score()
+        if result is None:
+            result = self.calculate_stability_score()
         
         if result["risk_level"] == "HIGH":
             return {
@@ -3,10 +3,12 @@ SilverSentinel Authentication Module
 JWT-based authentication for API endpoints
 """
 import os
+import time
 import hashlib
 import secrets
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from dataclasses import dataclass
 
 from fastapi import HTTPException, Depends, status
@@ -118,11 +120,36 @@ def create_access_token(user: User) -> str:
     return jwt.encode(payload, JWT_SECRET, algorithm=JWT_ALGORITHM)
 
 
+# Claims decode_token reads; tokens missing any of them are rejected
+REQUIRED_TOKEN_CLAIMS = ("sub", "email", "name", "exp", "iat")
+
+# Recently verified tokens: sha256(token) -> (valid until, epoch seconds; TokenData)
+# Dashboards send the same token every few seconds; skip re-verifying it
+TOKEN_CACHE_TTL_SECONDS = 5
+TOKEN_CACHE_MAX_ENTRIES = 10_000
+_token_cache: "OrderedDict[bytes, Tuple[float, TokenData]]" = OrderedDict()
+
+
 def decode_token(token: str) -> Optional[TokenData]:
     """Decode and validate JWT token"""
+    cache_key = hashlib.sha256(token.encode()).digest()
+    now = time.time()
+    
+    cached = _token_cache.get(cache_key)
+    if cached is not None:
+        if cached[0] > now:
+            _token_cache.move_to_end(cache_key)
+            return cached[1]
+        _token_cache.pop(cache_key, None)
+    
     try:
-        payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
-        return TokenData(
+        # Every claim read below must be present: a signed token without one
+        # is rejected (MissingRequiredClaimError -> None -> 401), not a KeyError/500
+        payload = jwt.decode(
+            token, JWT_SECRET, algorithms=[JWT_ALGORITHM],
+            options={"require": list(REQUIRED_TOKEN_CLAIMS)}
+        )
+        token_data = TokenData(
             user_id=payload["sub"],
             email=payload["email"],
             name=payload["name"],
@@ -133,6 +160,13 @@ def decode_token(token: str) -> Optional[TokenData]:
         return None
     except jwt.InvalidTokenError:
         return None
+    
+    # Never cache past the token's own expiry
+    _token_cache[cache_key] = (min(now + TOKEN_CACHE_TTL_SECONDS, payload["exp"]), token_data)
+    if len(_token_cache) > TOKEN_CACHE_MAX_ENTRIES:
+        _token_cache.popitem(last=False)  # Least recently used
+    
+    return token_data
 
 
 def validate_api_key(api_key: str) -> bool:
@@ -151,7 +151,7 @@ class MultiAgentConfig:
     
     # LLM settings
     agent_temperature: float = 0.3  # Lower = more consistent
-    max_tokens_per_agent: int = 500
+    max_tokens_per_agent: int = 384  # Tagged reply is ~4 lines + 2-3 sentences
     
     # Fallback behavior
     use_metrics_fallback: bool = True  # Use main's metrics if agents fail
@@ -193,6 +193,9 @@ class AppConfig:
     # WebSocket
     websocket_ping_interval: int = 30
     websocket_max_connections: int = 100
+    
+    # Uploads
+    max_upload_mb: int = int(os.getenv("MAX_UPLOAD_MB", "20"))
 
 
 def load_config() -> AppConfig:
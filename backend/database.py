@@ -2,11 +2,15 @@
 Database Models and Schema
 SQLAlchemy ORM models for SilverSentinel
 """
+import os
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Optional
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, Text, JSON, ForeignKey, CheckConstraint
+from typing import Optional, Iterator, AsyncIterator
+from sqlalchemy import create_engine, event, Column, Integer, String, Float, DateTime, Text, JSON, ForeignKey, CheckConstraint, Index
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship, sessionmaker, scoped_session
+from sqlalchemy.orm import relationship, sessionmaker, scoped_session, Session
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.pool import SingletonThreadPool, AsyncAdaptedQueuePool
 from config import config
 
 Base = declarative_base()
@@ -44,9 +48,23 @@ class Narrative(Base):
         CheckConstraint("phase IN ('birth', 'growth', 'peak', 'reversal', 'death')", name="valid_phase"),
         CheckConstraint("strength >= 0 AND strength <= 100", name="valid_strength"),
         CheckConstraint("sentiment >= -1.0 AND sentiment <= 1.0", name="valid_sentiment"),
+        # Partial index so the active-narratives listing walks (strength, id) in
+        # keyset order; the unfiltered listing uses the full one
+        Index("ix_narr_active_strength_id", strength.desc(), id.desc(), sqlite_where=phase != "death"),
+        Index("ix_narratives_strength_id", strength.desc(), id.desc()),
+        # Phase-filtered lookups (growth/peak) ordered by strength
+        Index("ix_narrative_phase_strength", phase, strength.desc()),
     )
     
-    def to_dict(self):
+    def to_dict(self, now: Optional[datetime] = None):
+        """
+        Serialize narrative
+        
+        Args:
+            now: Reference time for age_days; pass one value when
+                 serializing a list so the clock is read once
+        """
+        now = now or datetime.utcnow()
         return {
             "id": self.id,
             "name": self.name,
@@ -55,7 +73,7 @@ class Narrative(Base):
             "sentiment": self.sentiment,
             "birth_date": self.birth_date.isoformat() if self.birth_date else None,
             "last_updated": self.last_updated.isoformat() if self.last_updated else None,
-            "age_days": (datetime.utcnow() - self.birth_date).days if self.birth_date else 0,
+            "age_days": (now - self.birth_date).days if self.birth_date else 0,
             "article_count": self.article_count,
             "mention_velocity": self.mention_velocity,
             "price_correlation": self.price_correlation,
@@ -120,6 +138,12 @@ class PriceData(Base):
     
     source = Column(String(50), nullable=False, default="yfinance")
     
+    __table_args__ = (
+        # Covers the /api/price/history window scans (raw and bucketed) so
+        # they never touch the table rows
+        Index("ix_price_ts_ohlc", timestamp, price, open_price, high_price, low_price, close_price),
+    )
+    
     def to_dict(self):
         return {
             "timestamp": self.timestamp.isoformat(),
@@ -216,6 +240,11 @@ class SilverScan(Base):
     
     created_at = Column(DateTime, default=datetime.utcnow)
     
+    __table_args__ = (
+        # Per-user scan history, newest first; id breaks ties for keyset paging
+        Index("ix_silverscan_user_created_id", user_id, created_at.desc(), id.desc()),
+    )
+    
     def to_dict(self):
         return {
             "id": self.id,
@@ -252,6 +281,11 @@ class AgentVote(Base):
     # Relationships
     narrative = relationship("Narrative", backref="agent_votes")
     
+    __table_args__ = (
+        # Latest votes for a narrative
+        Index("ix_agentvote_narr_ts", narrative_id, timestamp.desc()),
+    )
+    
     def to_dict(self):
         return {
             "id": self.id,
@@ -305,22 +339,93 @@ class NarrativeSnapshot(Base):
         }
 
 
+# Narrative data version - bumped after every commit that wrote a Narrative,
+# so readers can cache serialized narrative views until it changes
+_narrative_version = 0
+
+def narratives_version() -> int:
+    """Current narrative data version"""
+    return _narrative_version
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_narrative_writes(session, flush_context):
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, Narrative):
+            session.info["narratives_changed"] = True
+            return
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_narrative_bulk_writes(orm_execute_state):
+    # Statement-level insert/update/delete(Narrative) never shows up in
+    # session.new/dirty/deleted, so flag it here as well
+    if not (orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is not None and mapper.class_ is Narrative:
+        orm_execute_state.session.info["narratives_changed"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_narrative_version(session):
+    global _narrative_version
+    if session.info.pop("narratives_changed", False):
+        _narrative_version += 1
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_narrative_writes(session):
+    session.info.pop("narratives_changed", None)
+
+
 # Database initialization
 _engine = None
 _session_factory = None
 
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Per-connection SQLite tuning, applied to both the sync and async engines"""
+    cursor = dbapi_connection.cursor()
+    # WAL lets readers on other connections proceed while a writer commits
+    cursor.execute("PRAGMA journal_mode=WAL")
+    # Under WAL, NORMAL only syncs at checkpoints - still crash-safe for the DB
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    # 64 MB page cache per connection (negative = KiB)
+    cursor.execute("PRAGMA cache_size=-65536")
+    cursor.close()
+
+
 def init_database():
     """Initialize database and create tables"""
     global _engine, _session_factory
     
     _engine = create_engine(
         f"sqlite:///{config.database.sqlite_path}",
+        # One SQLite connection per thread, reused across sessions (matches scoped_session).
+        # Sized for the main thread plus asyncio.to_thread's default executor so
+        # connections aren't evicted while a worker still holds one.
+        poolclass=SingletonThreadPool,
+        pool_size=min(32, (os.cpu_count() or 1) + 4) + 1,
+        connect_args={"check_same_thread": False},
         # CRITICAL: Enable session expiry to prevent cross-session conflicts
         pool_pre_ping=True,
         pool_recycle=3600
     )
+    
+    event.listen(_engine, "connect", _set_sqlite_pragmas)
+    
     Base.metadata.create_all(_engine)
     
+    # create_all skips indexes on tables that already exist
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(_engine, checkfirst=True)
+    
+    # Superseded by the indexes that end in id (keyset pagination)
+    with _engine.begin() as conn:
+        conn.exec_driver_sql("DROP INDEX IF EXISTS ix_narr_active_strength")
+        conn.exec_driver_sql("DROP INDEX IF EXISTS ix_silverscan_user_created")
+    
     # Use scoped_session for thread-safe session management
     _session_factory = scoped_session(sessionmaker(
         bind=_engine,
@@ -350,6 +455,94 @@ def get_session():
     return _session_factory()
 
 
+@contextmanager
+def session_scope() -> Iterator[Session]:
+    """
+    Scoped session as a context manager
+    
+        with session_scope() as session:
+            # your code
+    
+    Rolls back on error and removes the thread's session from the
+    registry on exit, replacing the get_session()/finally boilerplate.
+    """
+    session = get_session()
+    try:
+        yield session
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        _session_factory.remove()
+
+
+# Async engine for request handlers (same SQLite file, aiosqlite driver)
+_async_engine = None
+_async_session_factory = None
+
+def init_async_database():
+    """Initialize async engine and session factory"""
+    global _async_engine, _async_session_factory
+    
+    _async_engine = create_async_engine(
+        f"sqlite+aiosqlite:///{config.database.sqlite_path}",
+        # aiosqlite defaults to NullPool (a new connection + thread per session).
+        # Keep connections pooled instead; under WAL they read concurrently
+        # while the monitoring loop writes
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=10,
+        max_overflow=10,
+        pool_pre_ping=True,
+        pool_recycle=3600
+    )
+    
+    event.listen(_async_engine.sync_engine, "connect", _set_sqlite_pragmas)
+    
+    _async_session_factory = async_sessionmaker(
+        _async_engine,
+        expire_on_commit=False
+    )
+    
+    return _async_engine
+
+
+def new_async_session() -> AsyncSession:
+    """
+    Create a standalone AsyncSession (for code outside request handlers)
+    
+    Use as an async context manager so it is always closed:
+        async with new_async_session() as session:
+            ...
+    """
+    if _async_session_factory is None:
+        init_async_database()
+    
+    return _async_session_factory()
+
+
+async def get_async_session() -> AsyncIterator[AsyncSession]:
+    """
+    FastAPI dependency yielding an AsyncSession
+    
+    Usage:
+        async def endpoint(session: AsyncSession = Depends(get_async_session)):
+            result = await session.scalars(select(Narrative))
+    """
+    async with new_async_session() as session:
+        yield session
+
+
+async def dispose_async_database():
+    """Close pooled aiosqlite connections (call on shutdown)"""
+    global _async_engine, _async_session_factory
+    
+    if _async_engine is not None:
+        await _async_engine.dispose()
+    
+    _async_engine = None
+    _async_session_factory = None
+
+
 def close_all_sessions():
     """Close all sessions (useful for cleanup in tests)"""
     global _session_factory
@@ -2,11 +2,12 @@
 Hybrid Intelligence Engine
 Combines quantitative metrics (main branch) with multi-agent consensus (abhishek branch)
 """
-from typing import Dict, Any, List
-from datetime import datetime, timedelta
+import asyncio
+from typing import Dict, Any, List, Optional, Tuple
+from datetime import datetime
 
 from database import get_session, Narrative, Article
-from narrative.lifecycle_tracker import lifecycle_tracker
+from narrative.lifecycle_tracker import lifecycle_tracker, NarrativePhase
 from agent.trading_agent import trading_agent
 from multi_agent.orchestrator import multi_agent_orchestrator
 from config import config
@@ -38,96 +39,133 @@ class HybridEngine:
         """
         print(f"🔬 Hybrid analysis for narrative {narrative_id}")
         
+        # Agent inputs are loaded off the event loop; velocity is reused by the metrics pass
+        narrative, velocity, evidence = await asyncio.to_thread(
+            self._load_agent_inputs, narrative_id
+        )
+        
+        # Step 2: Multi-agent analysis (abhishek branch approach) - started first
+        # so the LLM round trips overlap with the metrics queries
+        print("   🤖 Running multi-agent consensus...")
+        agent_task = asyncio.create_task(self.multi_agent.analyze_narrative_multi({
+            "narrative_id": narrative_id,
+            "narrative_title": narrative.name,
+            "historical_volume_75pct": velocity.get("increase_ratio", 0) * 100,
+            "recent_peak_volume": velocity.get("current", 0) * 100,
+            "evidence": evidence
+        }))
+        
+        try:
+            # Step 1: Quantitative metrics (main branch approach)
+            print("   📊 Calculating quantitative metrics...")
+            metrics, strength_metrics, deterministic_phase = await asyncio.to_thread(
+                self._calculate_metrics, narrative, velocity
+            )
+        except BaseException:
+            agent_task.cancel()
+            raise
+        
+        agent_result = await agent_task
+        
+        # Step 3: Combine with confidence weighting
+        print("   ⚖️  Combining results...")
+        
+        # Get config values (with defaults if not defined yet)
+        agent_weight = getattr(config, 'hybrid', None)
+        if agent_weight and hasattr(agent_weight, 'agent_weight'):
+            agent_w = agent_weight.agent_weight
+            metrics_w = agent_weight.metrics_weight
+            high_threshold = agent_weight.high_confidence_threshold
+        else:
+            agent_w = 0.6
+            metrics_w = 0.4
+            high_threshold = 0.75
+        
+        if agent_result["overall_confidence"] >= high_threshold:
+            # High agent confidence - trust agents
+            final_phase = agent_result["consensus_lifecycle_phase"]
+            final_confidence = agent_result["overall_confidence"]
+            analysis_method = "multi-agent"
+        else:
+            # Low agent confidence - use deterministic metrics
+            final_phase = deterministic_phase.value if deterministic_phase else narrative.phase
+            final_confidence = 0.65
+            analysis_method = "metrics-fallback"
+        
+        # Weighted strength score
+        agent_strength = agent_result["consensus_strength_score"]
+        final_strength = int(
+            agent_w * agent_strength +
+            metrics_w * strength_metrics
+        )
+        
+        # Step 4: Generate explanation
+        explanation = self._generate_hybrid_explanation(
+            metrics, agent_result, final_phase, final_confidence
+        )
+        
+        result = {
+            "narrative_id": narrative_id,
+            "consensus_lifecycle_phase": final_phase,
+            "consensus_strength_score": final_strength,
+            "overall_confidence": final_confidence,
+            "num_agents": agent_result.get("num_agents", 5),
+            "analysis_method": analysis_method,
+            "agent_votes": agent_result["agent_votes"],
+            "minority_opinions": agent_result.get("minority_opinions", []),
+            "metrics": metrics,
+            "explanation": explanation,
+            "timestamp": datetime.utcnow().isoformat()
+        }
+        
+        # Step 5: Persist results to database
+        session = get_session()
+        try:
+            narrative = session.get(Narrative, narrative_id)
+            if narrative:
+                narrative.strength = final_strength
+                narrative.phase = final_phase
+                narrative.mention_velocity = metrics.get("current_velocity", 0)
+                narrative.price_correlation = metrics.get("price_correlation", 0)
+                session.commit()
+        finally:
+            session.close()
+        
+        print(f"   ✅ Hybrid analysis complete and saved: {final_phase} (strength: {final_strength})")
+        
+        return result
+    
+    def _load_agent_inputs(
+        self,
+        narrative_id: int
+    ) -> Tuple[Narrative, Dict[str, float], List[Dict[str, Any]]]:
+        """Load narrative, velocity and evidence (called off the event loop)"""
         session = get_session()
         
         try:
-            narrative = session.query(Narrative).get(narrative_id)
+            narrative = session.get(Narrative, narrative_id)
             
             if not narrative:
                 raise ValueError(f"Narrative {narrative_id} not found")
             
-            # Step 1: Quantitative metrics (main branch approach)
-            print("   📊 Calculating quantitative metrics...")
-            metrics = self.lifecycle_tracker.calculate_metrics(narrative)
-            strength_metrics = self.lifecycle_tracker.calculate_narrative_strength(narrative)
-            deterministic_phase = self.lifecycle_tracker.detect_phase_transition(narrative)
-            
-            # Step 2: Multi-agent analysis (abhishek branch approach)
-            print("   🤖 Running multi-agent consensus...")
+            velocity = self.lifecycle_tracker._calculate_velocity(narrative_id, session)
             evidence = self._gather_evidence(narrative, session)
-            agent_result = await self.multi_agent.analyze_narrative_multi({
-                "narrative_id": narrative_id,
-                "narrative_title": narrative.name,
-                "historical_volume_75pct": metrics.get("velocity_increase", 0) * 100,
-                "recent_peak_volume": metrics.get("current_velocity", 0) * 100,
-                "evidence": evidence
-            })
-            
-            # Step 3: Combine with confidence weighting
-            print("   ⚖️  Combining results...")
-            
-            # Get config values (with defaults if not defined yet)
-            agent_weight = getattr(config, 'hybrid', None)
-            if agent_weight and hasattr(agent_weight, 'agent_weight'):
-                agent_w = agent_weight.agent_weight
-                metrics_w = agent_weight.metrics_weight
-                high_threshold = agent_weight.high_confidence_threshold
-            else:
-                agent_w = 0.6
-                metrics_w = 0.4
-                high_threshold = 0.75
-            
-            if agent_result["overall_confidence"] >= high_threshold:
-                # High agent confidence - trust agents
-                final_phase = agent_result["consensus_lifecycle_phase"]
-                final_confidence = agent_result["overall_confidence"]
-                analysis_method = "multi-agent"
-            else:
-                # Low agent confidence - use deterministic metrics
-                final_phase = deterministic_phase or narrative.phase
-                final_confidence = 0.65
-                analysis_method = "metrics-fallback"
-            
-            # Weighted strength score
-            agent_strength = agent_result["consensus_strength_score"]
-            final_strength = int(
-                agent_w * agent_strength +
-                metrics_w * strength_metrics
-            )
-            
-            # Step 4: Generate explanation
-            explanation = self._generate_hybrid_explanation(
-                metrics, agent_result, final_phase, final_confidence
-            )
-            
-            result = {
-                "narrative_id": narrative_id,
-                "consensus_lifecycle_phase": final_phase,
-                "consensus_strength_score": final_strength,
-                "overall_confidence": final_confidence,
-                "num_agents": agent_result.get("num_agents", 5),
-                "analysis_method": analysis_method,
-                "agent_votes": agent_result["agent_votes"],
-                "minority_opinions": agent_result.get("minority_opinions", []),
-                "metrics": metrics,
-                "explanation": explanation,
-                "timestamp": datetime.utcnow().isoformat()
-            }
-            
-            # Step 5: Persist results to database
-            narrative.strength = final_strength
-            narrative.phase = final_phase
-            narrative.mention_velocity = metrics.get("current_velocity", 0)
-            narrative.price_correlation = metrics.get("price_correlation", 0)
-            session.commit()
-            
-            print(f"   ✅ Hybrid analysis complete and saved: {final_phase} (strength: {final_strength})")
-            
-            return result
-        
+            return narrative, velocity, evidence
         finally:
+            # Don't hold the SQLite connection across the awaits in the caller
             session.close()
     
+    def _calculate_metrics(
+        self,
+        narrative: Narrative,
+        velocity: Dict[str, float]
+    ) -> Tuple[Dict[str, Any], int, Optional[NarrativePhase]]:
+        """Run the synchronous metric calculations once (called off the event loop)"""
+        metrics = self.lifecycle_tracker.calculate_metrics(narrative, velocity=velocity)
+        strength_metrics = self.lifecycle_tracker.calculate_narrative_strength(narrative, metrics=metrics)
+        deterministic_phase = self.lifecycle_tracker.detect_phase_transition(narrative, metrics=metrics)
+        return metrics, strength_metrics, deterministic_phase
+    
     def _gather_evidence(self, narrative: Narrative, session) -> List[Dict[str, Any]]:
         """Gather evidence for multi-agent analysis"""
         articles = session.query(Article).filter(
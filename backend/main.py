@@ -1,21 +1,40 @@
 # Startup Trace Timestamp: 2026-01-25 19:49
 import sys
-print("--- [DEBUG] STARTING MAIN.PY IMPORT PHASE ---"); sys.stdout.flush()
 import os
-print("Importing FastAPI...")
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, UploadFile, File, Depends, Query
+
+# Import-phase trace for diagnosing container start-up (SILVERSENTINEL_DEBUG_STARTUP=1)
+_TRACE_STARTUP = os.getenv("SILVERSENTINEL_DEBUG_STARTUP", "false").lower() in ("1", "true")
+
+
+def _trace(message: str):
+    if _TRACE_STARTUP:
+        print(message, flush=True)
+
+
+_trace("--- [DEBUG] STARTING MAIN.PY IMPORT PHASE ---")
+_trace("Importing FastAPI...")
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, UploadFile, File, Depends, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response, ORJSONResponse
 from contextlib import asynccontextmanager
 import asyncio
-import aiofiles
+import functools
 import uuid
-print("Importing Path...")
+import hashlib
+import base64
+_trace("Importing Path...")
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set, Tuple, Callable, Awaitable
 from datetime import datetime
 import time
-print("Importing Pydantic..."); sys.stdout.flush()
+import orjson
+import logging
+import queue
+import atexit
+from logging.handlers import QueueHandler, QueueListener
+_trace("Importing Pydantic...")
 from pydantic import BaseModel, EmailStr, Field
+from config import config
 
 # Import core modules
 # NOTE: Heavy imports are now delayed to lifespan to ensure instant startup
@@ -23,36 +42,87 @@ from pydantic import BaseModel, EmailStr, Field
 # from narrative.resource_manager import resource_manager -> Moved
 # from narrative.pattern_hunter import pattern_hunter -> Moved
 # from narrative.lifecycle_tracker import lifecycle_tracker -> Moved
-print("DEBUG: Importing forecaster..."); sys.stdout.flush()
-from narrative.forecaster import forecaster
-print("DEBUG: Importing trading_agent..."); sys.stdout.flush()
-from agent.trading_agent import trading_agent
-print("DEBUG: Importing stability_monitor..."); sys.stdout.flush()
-from agent.stability_monitor import stability_monitor
-print("DEBUG: Importing orchestrator..."); sys.stdout.flush()
-from orchestrator import orchestrator
-
-# Import vision module
-print("DEBUG: Importing vision..."); sys.stdout.flush()
-from vision import VisionPipeline, ValuationEngine
+# forecaster, trading_agent, stability_monitor, orchestrator, vision,
+# hybrid_engine, multi_agent_orchestrator -> Moved to _load_core_modules()
 
 # Import database utilities
-print("Importing Database..."); sys.stdout.flush()
-from database import get_session, Narrative, PriceData, TradingSignal, SilverScan, AgentVote
-
-# Import hybrid intelligence system
-print("DEBUG: Importing hybrid_engine..."); sys.stdout.flush()
-from hybrid_engine import hybrid_engine
-print("DEBUG: Importing multi_agent orchestrator..."); sys.stdout.flush()
-from multi_agent.orchestrator import multi_agent_orchestrator
+_trace("Importing Database...")
+from database import session_scope, get_async_session, new_async_session, dispose_async_database, narratives_version, Narrative, PriceData, TradingSignal, SilverScan, AgentVote
+from sqlalchemy import select, insert, func, case, tuple_, Integer
+from sqlalchemy.ext.asyncio import AsyncSession
 
 # Import authentication
-print("DEBUG: Importing auth..."); sys.stdout.flush()
+_trace("DEBUG: Importing auth...")
 from auth import (
     create_user, authenticate_user, create_access_token,
     require_auth, optional_auth, TokenData
 )
-print("DEBUG: All imports complete!"); sys.stdout.flush()
+_trace("DEBUG: All imports complete!")
+
+
+class _RepeatThrottle(logging.Filter):
+    """
+    Drop repeats of the same warning/error within `interval` seconds
+    
+    Keyed on the unformatted message, its args and the call site, so an
+    error storm (one bad narrative id hammered by a client) logs once per
+    second instead of formatting a traceback per request, while a shared
+    call site (handle_errors) still logs each failing endpoint.
+    """
+    
+    def __init__(self, interval: float = 1.0, max_keys: int = 1024):
+        super().__init__()
+        self.interval = interval
+        self.max_keys = max_keys
+        self._last_emitted: Dict[tuple, float] = {}
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno < logging.WARNING:
+            return True
+        
+        args = record.args
+        try:
+            hash(args)
+        except TypeError:
+            args = repr(args)
+        key = (record.msg, args, record.pathname, record.lineno)
+        now = time.monotonic()
+        last = self._last_emitted.get(key)
+        if last is not None and now - last < self.interval:
+            return False
+        
+        if len(self._last_emitted) >= self.max_keys:
+            self._last_emitted.clear()
+        self._last_emitted[key] = now
+        return True
+
+
+def _configure_logging() -> logging.Logger:
+    """
+    App logger whose records are written to stdout by a background thread
+    
+    Handlers only enqueue, so logging from the event loop (connects,
+    broadcasts, monitoring errors) never blocks on a slow stdout.
+    """
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+    
+    listener = QueueListener(log_queue, stream_handler)
+    listener.start()
+    atexit.register(listener.stop)  # Flush queued records on exit
+    
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.addFilter(_RepeatThrottle())
+    
+    app_logger = logging.getLogger("silversentinel")
+    app_logger.addHandler(queue_handler)
+    app_logger.setLevel(config.log_level.upper())
+    app_logger.propagate = False
+    return app_logger
+
+
+logger = _configure_logging()
 
 
 # Pydantic models for request validation
@@ -78,70 +148,150 @@ MAX_BACKGROUND_TASKS = 100
 background_tasks: set = set()
 
 
+def _spawn(coro) -> asyncio.Task:
+    """Start a tracked background task, refusing once MAX_BACKGROUND_TASKS are running"""
+    if len(background_tasks) >= MAX_BACKGROUND_TASKS:
+        coro.close()  # Never started - avoid the "never awaited" warning
+        raise HTTPException(status_code=503, detail="Task queue full")
+    
+    task = asyncio.create_task(coro)
+    background_tasks.add(task)
+    task.add_done_callback(background_tasks.discard)
+    return task
+
+
 # Global placeholders for lazy loading
 collector = None
 resource_manager = None
 pattern_hunter = None
 lifecycle_tracker = None
+forecaster = None
+trading_agent = None
+stability_monitor = None
+orchestrator = None  # LLM router (Groq/Gemini clients)
+hybrid_engine = None
+multi_agent_orchestrator = None
+vision_pipeline = None  # OpenCV + vision LLMs
+valuation_engine = None
+discovery_engine = None  # Loaded on first /api/narratives/discover call (holds the embedding model)
+
+
+def _load_core_modules():
+    """
+    Import the service modules and bind their singletons
+    
+    These pull in the LLM SDKs, OpenCV and the agent stack (seconds of
+    import time), so `import main` stays cheap and the cost is paid once
+    in lifespan. Set SILVERSENTINEL_EAGER_IMPORT=1 to load at import
+    time instead (surfaces import errors in CI without starting the app).
+    """
+    global collector, resource_manager, pattern_hunter, lifecycle_tracker
+    global forecaster, trading_agent, stability_monitor, orchestrator
+    global hybrid_engine, multi_agent_orchestrator, vision_pipeline, valuation_engine
+    
+    import data_collection
+    collector = data_collection.collector
+    
+    import narrative.resource_manager
+    resource_manager = narrative.resource_manager.resource_manager
+    
+    import narrative.pattern_hunter
+    pattern_hunter = narrative.pattern_hunter.pattern_hunter
+    
+    import narrative.lifecycle_tracker
+    lifecycle_tracker = narrative.lifecycle_tracker.lifecycle_tracker
+    
+    from narrative.forecaster import forecaster
+    from agent.trading_agent import trading_agent
+    from agent.stability_monitor import stability_monitor
+    from orchestrator import orchestrator
+    from hybrid_engine import hybrid_engine
+    from multi_agent.orchestrator import multi_agent_orchestrator
+    
+    from vision import VisionPipeline, ValuationEngine
+    vision_pipeline = VisionPipeline()
+    valuation_engine = ValuationEngine()
+
+
+if os.getenv("SILVERSENTINEL_EAGER_IMPORT", "false").lower() in ("1", "true"):
+    _load_core_modules()
+
+# Held for the process lifetime by the one worker that runs background monitoring
+_monitoring_lock_file = None
+
+
+def _acquire_monitoring_lock() -> bool:
+    """
+    Elect a single worker to run background monitoring
+    
+    With `workers > 1` every uvicorn process runs lifespan; only the one
+    holding this file lock starts the monitoring loop.
+    """
+    global _monitoring_lock_file
+    
+    try:
+        import fcntl
+    except ImportError:
+        return True  # No flock (Windows) - single-worker dev setups only
+    
+    lock_file = open(f"{config.database.sqlite_path}.monitor.lock", "w")
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock_file.close()
+        return False
+    
+    _monitoring_lock_file = lock_file
+    return True
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan events with enhanced diagnostic logging"""
-    print("🚀 [STARTUP] SilverSentinel backend is initializing...")
+    logger.info("🚀 [STARTUP] SilverSentinel backend is initializing...")
     
-    # Initialize globals lazily
-    global collector, resource_manager, pattern_hunter, lifecycle_tracker
+    # Tasks that finish without suspending (cache hits, early returns) complete
+    # inline instead of taking a trip through the ready queue (Python 3.12+)
+    if sys.version_info >= (3, 12):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
     
     try:
         # Step 1: Initialize database
-        print("📁 [STARTUP] Initializing database..."); sys.stdout.flush()
+        logger.info("📁 [STARTUP] Initializing database...")
         from database import init_database
         init_database()
         
         # Step 1.5: Seed demo data if database is empty
         # Note: Hugging Face Spaces block external API calls (NewsAPI, yfinance)
         # So we use realistic demo data instead
-        session = get_session()
-        narrative_count = session.query(Narrative).count()
-        session.close()
+        async with new_async_session() as session:
+            narrative_count = await session.scalar(select(func.count(Narrative.id)))
         
         if narrative_count == 0:
-            print("🌱 [STARTUP] Database is empty, seeding demo data..."); sys.stdout.flush()
-            print("ℹ️ [STARTUP] Note: Using demo data (HF Spaces block external APIs)"); sys.stdout.flush()
+            logger.info("🌱 [STARTUP] Database is empty, seeding demo data...")
+            logger.info("ℹ️ [STARTUP] Note: Using demo data (HF Spaces block external APIs)")
             try:
                 from seed_demo_data import DemoDataSeeder
                 seeder = DemoDataSeeder()
                 await seeder.seed_all()
-                print("✅ [STARTUP] Demo data seeded successfully!"); sys.stdout.flush()
+                logger.info("✅ [STARTUP] Demo data seeded successfully!")
             except Exception as e:
-                print(f"⚠️ [STARTUP] Failed to seed demo data: {e}"); sys.stdout.flush()
-                import traceback
-                traceback.print_exc()
+                logger.exception("⚠️ [STARTUP] Failed to seed demo data: %s", e)
         else:
-            print(f"📊 [STARTUP] Database has {narrative_count} narratives, skipping seed"); sys.stdout.flush()
+            logger.info("📊 [STARTUP] Database has %d narratives, skipping seed", narrative_count)
         
         # Step 2: Lazy load heavy modules
-        print("📥 [STARTUP] Loading core modules..."); sys.stdout.flush()
-        
-        import data_collection
-        collector = data_collection.collector
-        
-        import narrative.resource_manager
-        resource_manager = narrative.resource_manager.resource_manager
-        
-        import narrative.pattern_hunter
-        pattern_hunter = narrative.pattern_hunter.pattern_hunter
-        
-        import narrative.lifecycle_tracker
-        lifecycle_tracker = narrative.lifecycle_tracker.lifecycle_tracker
+        logger.info("📥 [STARTUP] Loading core modules...")
+        if trading_agent is None:
+            _load_core_modules()
         
         # Step 3: Start background monitoring
-        print("📡 [STARTUP] Starting background tasks..."); sys.stdout.flush()
+        logger.info("📡 [STARTUP] Starting background tasks...")
         
         async def delayed_monitoring():
-            print("⏳ [STARTUP] Deferring background tasks for 10 seconds to allow health check...")
+            logger.info("⏳ [STARTUP] Deferring background tasks for 10 seconds to allow health check...")
             await asyncio.sleep(10)
-            print("🤖 [STARTUP] Starting continuous monitoring task...")
+            logger.info("🤖 [STARTUP] Starting continuous monitoring task...")
             # We must import run_continuous_monitoring here or have it available
             # Assuming it is defined later in this file, we can call it.
             # If not, we need to import it. But usually it is defined in main.py.
@@ -149,32 +299,63 @@ async def lifespan(app: FastAPI):
             # It seems it is defined below. 
             await run_continuous_monitoring()
 
-        task = asyncio.create_task(delayed_monitoring())
-        background_tasks.add(task)
-        task.add_done_callback(lambda t: background_tasks.discard(t))
-        print("📡 [STARTUP] Background tasks scheduled!"); sys.stdout.flush()
+        if _acquire_monitoring_lock():
+            _spawn(delayed_monitoring())
+        else:
+            logger.info("ℹ️ [STARTUP] Monitoring runs in another worker, skipping")
+        
+        _spawn(manager.run_broadcaster())
+        _spawn(live_snapshot.run())
+        logger.info("📡 [STARTUP] Background tasks scheduled!")
         
     except Exception as e:
-        print(f"❌ [STARTUP] CRITICAL FAILURE DURING LIFESPAN: {e}"); sys.stdout.flush()
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ [STARTUP] CRITICAL FAILURE DURING LIFESPAN: %s", e)
 
-    print("🌟 [STARTUP] Lifespan complete - server is ready to accept connections"); sys.stdout.flush()
+    logger.info("🌟 [STARTUP] Lifespan complete - server is ready to accept connections")
     yield
     
     # Cleanup
-    print("🛑 [SHUTDOWN] Shutting down SilverSentinel...")
-    for task in background_tasks:
+    logger.info("🛑 [SHUTDOWN] Shutting down SilverSentinel...")
+    for task in list(background_tasks):
         task.cancel()
+    
+    await dispose_async_database()
 
 
 app = FastAPI(
     title="SilverSentinel API",
     description="Autonomous AI-driven silver market intelligence and trading platform",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    # orjson encodes the dict/list-heavy responses several times faster than stdlib json
+    default_response_class=ORJSONResponse
 )
 
+# Allowance for multipart boundaries/headers on top of the image itself
+UPLOAD_MULTIPART_OVERHEAD_BYTES = 64 * 1024
+
+
+@app.middleware("http")
+async def reject_oversized_scans(request: Request, call_next):
+    """
+    413 a scan upload whose declared Content-Length is over the limit
+    
+    Runs before FastAPI parses the multipart body, so the request is refused
+    without being read. Uploads without a Content-Length are still capped
+    while /api/scan spools them to disk. Registered before CORS so the 413
+    still carries CORS headers.
+    """
+    if request.method == "POST" and request.url.path == "/api/scan":
+        content_length = request.headers.get("content-length", "")
+        max_bytes = config.max_upload_mb * 1024 * 1024
+        if content_length.isdigit() and int(content_length) > max_bytes + UPLOAD_MULTIPART_OVERHEAD_BYTES:
+            return ORJSONResponse(
+                status_code=413,
+                content={"detail": f"Image exceeds {config.max_upload_mb} MB upload limit"}
+            )
+    return await call_next(request)
+
+
 # CORS middleware - Configure allowed origins from environment
 # Default to localhost dev origins; can be overridden with ALLOWED_ORIGINS env (comma-separated)
 ALLOWED_ORIGINS = os.getenv("ALLOWED_ORIGINS", "http://localhost:3000,http://127.0.0.1:3000").split(",")
@@ -271,61 +452,242 @@ async def get_current_user_info(current_user: TokenData = Depends(require_auth))
 # Narrative Endpoints
 # =====================
 
+class AsyncTTLCache:
+    """
+    Small in-process TTL cache for polled endpoint results
+    
+    Concurrent misses for the same key share one computation, so a burst
+    of dashboard polls costs a single set of queries. The computation runs
+    as its own task (and must open its own session) so a disconnecting
+    client can't cancel it for everyone else.
+    """
+    
+    def __init__(self, ttl_seconds: float, maxsize: int = 64):
+        self.ttl_seconds = ttl_seconds
+        self.maxsize = maxsize
+        self._entries: Dict[Any, Tuple[float, Any]] = {}
+        self._inflight: Dict[Any, asyncio.Task] = {}
+    
+    async def get_or_compute(self, key: Any, compute: Callable[[], Awaitable[Any]]) -> Any:
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() - entry[0] < self.ttl_seconds:
+            return entry[1]
+        
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(compute())
+            if task.done():
+                # Eager task factory may have finished it already
+                self._store(key, task)
+            else:
+                self._inflight[key] = task
+                task.add_done_callback(lambda t: self._store(key, t))
+        
+        return await asyncio.shield(task)
+    
+    def is_fresh(self, key: Any) -> bool:
+        """Whether get_or_compute would answer `key` from the cache right now"""
+        entry = self._entries.get(key)
+        return entry is not None and time.monotonic() - entry[0] < self.ttl_seconds
+    
+    def _store(self, key: Any, task: asyncio.Task):
+        self._inflight.pop(key, None)
+        if task.cancelled() or task.exception() is not None:
+            return  # Errors aren't cached; the next caller retries
+        
+        if key not in self._entries and len(self._entries) >= self.maxsize:
+            self._entries.pop(next(iter(self._entries)))  # Oldest insert
+        self._entries[key] = (time.monotonic(), task.result())
+
+
+# Stats/status/price are polled by dashboards but change on minute timescales
+endpoint_cache = AsyncTTLCache(ttl_seconds=15)
+
+# Signals are expensive (metrics, price fetch, DB write); overlapping
+# callers within a few seconds share one
+signal_cache = AsyncTTLCache(ttl_seconds=5, maxsize=1)
+
+# Slow-moving context (bias report, scan market context); keyed by the
+# narrative data version where the result depends on narratives
+context_cache = AsyncTTLCache(ttl_seconds=60)
+
+
+async def _current_signal():
+    """Latest trading signal, deduplicated across concurrent callers"""
+    return await signal_cache.get_or_compute("signal", trading_agent.generate_signal)
+
+
+def _etag_for(body: bytes) -> str:
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+async def _encode_json(payload: Awaitable[Any]) -> Tuple[bytes, str]:
+    """Await a payload and return its JSON body with an ETag (cacheable as a pair)"""
+    body = orjson.dumps(await payload, option=orjson.OPT_SERIALIZE_NUMPY)
+    return body, _etag_for(body)
+
+
+def _etag_response(
+    request: Request,
+    body: bytes,
+    etag: str,
+    headers: Optional[Dict[str, str]] = None
+) -> Response:
+    """JSON response carrying an ETag; bodyless 304 if the client already has it"""
+    headers = {"ETag": etag, **(headers or {})}
+    
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        client_tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        if "*" in client_tags or etag in client_tags:
+            return Response(status_code=304, headers=headers)
+    
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _encode_cursor(*values: Any) -> str:
+    """Opaque keyset cursor for the last row of a page"""
+    return base64.urlsafe_b64encode(orjson.dumps(values)).decode()
+
+
+def _decode_cursor(cursor: str, datetime_key: bool = False) -> Tuple[Any, int]:
+    """
+    Decode a cursor into (sort key, id), rejecting malformed ones with 400
+    
+    The sort key is a number, or an ISO timestamp parsed to a datetime when
+    `datetime_key` is set; the id must be an int. Anything else would only
+    fail later at the SQL bind, as a 500.
+    """
+    try:
+        values = orjson.loads(base64.urlsafe_b64decode(cursor))
+    except ValueError:
+        values = None
+    if not isinstance(values, list) or len(values) != 2:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    
+    key, row_id = values
+    if type(row_id) is not int:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if datetime_key:
+        try:
+            key = datetime.fromisoformat(key)
+        except (TypeError, ValueError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+    elif type(key) not in (int, float):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return key, row_id
+
+
+# Serialized /api/narratives pages (cursor-less only, so client-supplied
+# cursors can't evict the real first pages), valid for one narrative data version.
+# The TTL is a backstop for writes this process can't see: other uvicorn
+# workers (only the lock holder runs monitoring) and raw Connection writes.
+_narratives_cache: Dict[tuple, Tuple[float, bytes, str]] = {}
+_narratives_cache_version = -1
+_NARRATIVES_CACHE_MAX_PAGES = 256
+_NARRATIVES_CACHE_TTL_SECONDS = 15
+
+
 @app.get("/narratives")
 @app.get("/api/narratives")
 async def get_narratives(
+    request: Request,
     active_only: bool = True,
     page: int = Query(default=1, ge=1, description="Page number (1-indexed)"),
-    limit: int = Query(default=20, ge=1, le=100, description="Items per page (1-100)")
+    limit: int = Query(default=20, ge=1, le=100, description="Items per page (1-100)"),
+    cursor: Optional[str] = Query(default=None, description="next_cursor from the previous page"),
+    include_total: bool = Query(default=False, description="Also compute total_count/total_pages"),
+    session: AsyncSession = Depends(get_async_session)
 ):
     """
     Get all narratives with pagination
     
     Args:
         active_only: If True, only return non-dead narratives
-        page: Page number (1-indexed)
+        page: Page number (1-indexed); ignored when cursor is given
         limit: Number of items per page (max 100)
+        cursor: Keyset cursor - seeks past the previous page instead of
+            scanning `offset` rows
+        include_total: Run the extra COUNT query for total_count/total_pages
+    
+    Page-numbered requests are served from a cached JSON body until a
+    commit touches the narratives table, or for at most
+    _NARRATIVES_CACHE_TTL_SECONDS. Cursor pages are always queried.
     """
-    session = get_session()
+    global _narratives_cache_version
     
-    try:
-        query = session.query(Narrative)
-        
-        if active_only:
-            query = query.filter(Narrative.phase != 'death')
-        
-        # Get total count for pagination metadata
-        total_count = query.count()
-        
-        # Apply pagination
-        offset = (page - 1) * limit
-        narratives = query.order_by(Narrative.strength.desc()).offset(offset).limit(limit).all()
-        
-        # Calculate pagination metadata
+    version = narratives_version()
+    if version != _narratives_cache_version:
+        _narratives_cache.clear()
+        _narratives_cache_version = version
+    
+    cache_key = (active_only, page, limit, include_total)
+    cached = _narratives_cache.get(cache_key) if cursor is None else None
+    if cached is not None and cached[0] > time.monotonic():
+        return _etag_response(request, cached[1], cached[2], {"X-Cache": "HIT"})
+    
+    query = select(Narrative)
+    
+    if active_only:
+        query = query.where(Narrative.phase != 'death')
+    
+    # Total count only on request - has_next comes from fetching one extra row
+    total_count = total_pages = None
+    if include_total:
+        total_count = await session.scalar(
+            select(func.count()).select_from(query.subquery())
+        )
         total_pages = (total_count + limit - 1) // limit  # Ceiling division
-        
-        return {
-            "narratives": [n.to_dict() for n in narratives],
-            "count": len(narratives),
-            "pagination": {
-                "page": page,
-                "limit": limit,
-                "total_count": total_count,
-                "total_pages": total_pages,
-                "has_next": page < total_pages,
-                "has_prev": page > 1
-            },
-            "timestamp": datetime.utcnow().isoformat()
-        }
     
-    finally:
-        session.close()
+    # Apply pagination (id breaks strength ties so pages are stable)
+    query = query.order_by(Narrative.strength.desc(), Narrative.id.desc())
+    if cursor is not None:
+        last_strength, last_id = _decode_cursor(cursor)
+        query = query.where(tuple_(Narrative.strength, Narrative.id) < (last_strength, last_id))
+    else:
+        query = query.offset((page - 1) * limit)
+    narratives = (await session.scalars(query.limit(limit + 1))).all()
+    
+    has_next = len(narratives) > limit
+    narratives = narratives[:limit]
+    
+    now = datetime.utcnow()
+    body = orjson.dumps({
+        "narratives": [n.to_dict(now) for n in narratives],
+        "count": len(narratives),
+        "pagination": {
+            "page": page,
+            "limit": limit,
+            "total_count": total_count,
+            "total_pages": total_pages,
+            "has_next": has_next,
+            "has_prev": cursor is not None or page > 1,
+            "next_cursor": (
+                _encode_cursor(narratives[-1].strength, narratives[-1].id)
+                if has_next else None
+            )
+        },
+        "timestamp": now.isoformat()
+    })
+    etag = _etag_for(body)
+    
+    # Don't cache a page if a write landed while we were reading
+    if cursor is None and narratives_version() == version:
+        now_mono = time.monotonic()
+        if len(_narratives_cache) >= _NARRATIVES_CACHE_MAX_PAGES:
+            for key in [k for k, v in _narratives_cache.items() if v[0] <= now_mono]:
+                del _narratives_cache[key]
+        if len(_narratives_cache) < _NARRATIVES_CACHE_MAX_PAGES:
+            _narratives_cache[cache_key] = (now_mono + _NARRATIVES_CACHE_TTL_SECONDS, body, etag)
+    
+    return _etag_response(request, body, etag, {"X-Cache": "MISS"})
 
 
 @app.get("/api/narratives/{narrative_id}")
 async def get_narrative_detail(narrative_id: int):
     """Get detailed information about a specific narrative"""
-    status = lifecycle_tracker.get_narrative_status(narrative_id)
+    # Lifecycle metrics still use the sync session - keep them off the event loop
+    status = await asyncio.to_thread(lifecycle_tracker.get_narrative_status, narrative_id)
     
     if not status:
         raise HTTPException(status_code=404, detail="Narrative not found")
@@ -334,32 +696,31 @@ async def get_narrative_detail(narrative_id: int):
 
 
 @app.get("/api/narratives/{narrative_id}/forecast")
-async def get_narrative_forecast(narrative_id: int):
+async def get_narrative_forecast(
+    narrative_id: int,
+    session: AsyncSession = Depends(get_async_session)
+):
     """Get 48h forecast for a narrative"""
-    session = get_session()
-    try:
-        narrative = session.query(Narrative).filter(Narrative.id == narrative_id).first()
-        if not narrative:
-            raise HTTPException(status_code=404, detail="Narrative not found")
-        
-        lifecycle_pred = forecaster.predict_lifecycle(narrative)
-        price_pred = forecaster.predict_price_impact(narrative)
-        
-        return {
-            "narrative_id": narrative_id,
-            "lifecycle_forecast": lifecycle_pred,
-            "price_impact_forecast": price_pred,
-            "timestamp": datetime.utcnow().isoformat()
-        }
-    finally:
-        session.close()
+    narrative = await session.get(Narrative, narrative_id)
+    if not narrative:
+        raise HTTPException(status_code=404, detail="Narrative not found")
+    
+    lifecycle_pred = forecaster.predict_lifecycle(narrative)
+    price_pred = forecaster.predict_price_impact(narrative)
+    
+    return {
+        "narrative_id": narrative_id,
+        "lifecycle_forecast": lifecycle_pred,
+        "price_impact_forecast": price_pred,
+        "timestamp": datetime.utcnow().isoformat()
+    }
 
 
 @app.get("/trading-signal")
 @app.get("/api/trading-signal")
 async def get_trading_signal():
     """Get current trading recommendation"""
-    signal = await trading_agent.generate_signal()
+    signal = await _current_signal()
     
     return {
         "signal": {
@@ -377,15 +738,20 @@ async def get_trading_signal():
     }
 
 
+async def _fetch_current_price():
+    price_data = await collector.price_collector.fetch_price_data()
+    if not price_data:
+        # Raised rather than returned so the failure isn't cached for the TTL
+        raise HTTPException(status_code=503, detail="Unable to fetch current price")
+    return price_data
+
+
 @app.get("/price/current")
 @app.get("/api/price/current")
 async def get_current_price():
     """Get current silver price in INR per gram"""
-    # Fetch fresh price data from collector
-    price_data = await collector.price_collector.fetch_price_data()
-    
-    if not price_data:
-        raise HTTPException(status_code=503, detail="Unable to fetch current price")
+    # Fetch price data from collector (shared across callers for a few seconds)
+    price_data = await endpoint_cache.get_or_compute("current_price", _fetch_current_price)
     
     return {
         "price": price_data.get("current_price"),
@@ -403,137 +769,240 @@ async def get_current_price():
 @app.get("/price/history")
 @app.get("/api/price/history")
 async def get_price_history(
-    hours: int = Query(default=24, ge=1, le=168, description="Hours of history (1-168)")
+    request: Request,
+    hours: int = Query(default=24, ge=1, le=168, description="Hours of history (1-168)"),
+    limit: int = Query(default=500, ge=1, le=2000, description="Max points returned (1-2000)"),
+    before: Optional[datetime] = Query(default=None, description="Only points older than this (next_cursor)"),
+    session: AsyncSession = Depends(get_async_session)
 ):
     """
     Get price history in INR per gram
     
-    First tries to fetch from database, then falls back to yfinance for historical data
+    First tries to fetch from database, then falls back to yfinance for historical data.
+    Returns at most `limit` of the newest points in the window; when more
+    remain, `next_cursor` is the `before` value for the next (older) page.
+    Windows over 24 hours are averaged into time buckets (~500 points).
     """
     from datetime import timedelta
     
-    session = get_session()
-    try:
-        # Calculate time range
-        end_time = datetime.utcnow()
-        start_time = end_time - timedelta(hours=hours)
+    # Calculate time range
+    end_time = datetime.utcnow()
+    start_time = end_time - timedelta(hours=hours)
+    
+    next_cursor = None
+    if hours > PRICE_HISTORY_RAW_HOURS and before is None:
+        # Wide window - aggregate in SQL instead of shipping every row
+        prices = (await _bucketed_price_history(session, start_time, hours))[-limit:]
+    else:
+        # Newest first, one extra row to detect more. Only the columns in
+        # ix_price_ts_ohlc, so SQLite answers from the index alone
+        query = select(
+            PriceData.timestamp, PriceData.price, PriceData.open_price,
+            PriceData.high_price, PriceData.low_price, PriceData.close_price
+        ).where(PriceData.timestamp >= start_time)
+        if before is not None:
+            query = query.where(PriceData.timestamp < before)
+        db_prices = (await session.execute(
+            query.order_by(PriceData.timestamp.desc()).limit(limit + 1)
+        )).all()
         
-        # Try to get from database first
-        db_prices = session.query(PriceData).filter(
-            PriceData.timestamp >= start_time
-        ).order_by(PriceData.timestamp.asc()).all()
+        has_more = len(db_prices) > limit
+        db_prices = db_prices[:limit][::-1]
+        next_cursor = db_prices[0].timestamp.isoformat() if has_more else None
         
-        if db_prices and len(db_prices) >= 5:
-            # Use database data
+        prices = [
+            {
+                "price": round(p.price, 2),
+                "timestamp": p.timestamp.isoformat(),
+                "open": p.open_price,
+                "high": p.high_price,
+                "low": p.low_price,
+                "close": p.close_price
+            }
+            for p in db_prices
+        ]
+    
+    if before is None and len(prices) < 5:
+        # Fetch from yfinance and cache (blocking network + sync writes - run in a worker)
+        logger.info("📡 [PRICE] Fetching historical data from yfinance...")
+        try:
+            prices = await asyncio.to_thread(_fetch_and_cache_yfinance_history, hours)
+        
+        except Exception as e:
+            logger.warning("yfinance fetch failed: %s, using simulated data", e)
+            # Fallback to simulated data
+            import numpy as np
+            current_data = await collector.price_collector.fetch_price_data()
+            current_price = current_data.get("current_price", 80.0) if current_data else 80.0
+            
+            points = min(hours * 4, 96)
+            steps = np.arange(points) / points
+            variations = np.random.uniform(-0.02, 0.02, points) * current_price
+            trends = (steps - 0.5) * current_price * 0.01
+            simulated = np.round(current_price + variations + trends, 2).tolist()
+            
+            now = datetime.utcnow()
             prices = [
                 {
-                    "price": round(p.price, 2),
-                    "timestamp": p.timestamp.isoformat(),
-                    "open": p.open_price,
-                    "high": p.high_price,
-                    "low": p.low_price,
-                    "close": p.close_price
+                    "price": price,
+                    "timestamp": (now - timedelta(hours=hours * (1 - step))).isoformat(),
                 }
-                for p in db_prices
+                for price, step in zip(simulated, steps.tolist())
             ]
-        else:
-            # Fetch from yfinance and cache
-            print("📡 [PRICE] Fetching historical data from yfinance..."); sys.stdout.flush()
-            try:
-                import yfinance as yf
-                
-                # Get silver ETF data (SLV) and convert to INR/gram
-                ticker = yf.Ticker("SI=F")  # Silver futures
-                # Use history instead of info
-                hist_period = f"{min(hours // 24 + 1, 7)}d"
-                hist = ticker.history(period=hist_period, interval="1h")
-                
-                # Get USD to INR rate reliably
-                try:
-                    usd_inr_ticker = yf.Ticker("USDINR=X")
-                    usd_inr_hist = usd_inr_ticker.history(period="1d")
-                    usd_inr_rate = usd_inr_hist["Close"].iloc[-1] if not usd_inr_hist.empty else 83.5
-                    print(f"✅ [PRICE] USD/INR rate: {usd_inr_rate}"); sys.stdout.flush()
-                except:
-                    usd_inr_rate = 83.5
-                    print("⚠️ [PRICE] Using default USD/INR rate: 83.5"); sys.stdout.flush()
-                
-                # Convert: Silver is in USD/troy oz, we need INR/gram
-                INDIA_PREMIUM = 4.15
-                conversion_factor = (usd_inr_rate / 31.1035) * INDIA_PREMIUM
-                
-                prices = []
-                if not hist.empty:
-                    for timestamp, row in hist.iterrows():
-                        price_inr = row["Close"] * conversion_factor
-                        price_entry = {
-                            "price": round(price_inr, 2),
-                            "timestamp": timestamp.isoformat(),
-                            "open": round(row["Open"] * conversion_factor, 2) if "Open" in row else None,
-                            "high": round(row["High"] * conversion_factor, 2) if "High" in row else None,
-                            "low": round(row["Low"] * conversion_factor, 2) if "Low" in row else None,
-                            "close": round(row["Close"] * conversion_factor, 2) if "Close" in row else None
-                        }
-                        prices.append(price_entry)
-                        
-                        # Cache in database
-                        db_price = PriceData(
-                            timestamp=timestamp.to_pydatetime(),
-                            price=price_inr,
-                            open_price=row["Open"] * conversion_factor if "Open" in row else None,
-                            high_price=row["High"] * conversion_factor if "High" in row else None,
-                            low_price=row["Low"] * conversion_factor if "Low" in row else None,
-                            close_price=row["Close"] * conversion_factor if "Close" in row else None,
-                            volume=row["Volume"] if "Volume" in row else None,
-                            source="yfinance"
-                        )
-                        session.merge(db_price)
-                    
-                    session.commit()
-                    print(f"✅ [PRICE] Cached {len(prices)} price points"); sys.stdout.flush()
-                else:
-                    print("⚠️ [PRICE] yfinance returned empty history"); sys.stdout.flush()
-                    raise Exception("Empty history")
-            
-            except Exception as e:
-                print(f"yfinance fetch failed: {e}, using simulated data")
-                # Fallback to simulated data
-                import random
-                current_data = await collector.price_collector.fetch_price_data()
-                current_price = current_data.get("current_price", 80.0) if current_data else 80.0
-                
-                prices = []
-                points = min(hours * 4, 96)
-                
-                for i in range(points):
-                    hours_ago = hours * (1 - i / points)
-                    timestamp = datetime.utcnow() - timedelta(hours=hours_ago)
-                    variation = random.uniform(-0.02, 0.02) * current_price
-                    trend = (i / points - 0.5) * current_price * 0.01
-                    price = current_price + variation + trend
-                
-                    prices.append({
-                        "price": round(price, 2),
-                        "timestamp": timestamp.isoformat(),
-                    })
         
-        return {
-            "prices": prices,
-            "count": len(prices),
-            "hours": hours,
-            "unit": "per gram",
-            "currency": "INR"
+        prices = prices[-limit:]
+    
+    body = orjson.dumps({
+        "prices": prices,
+        "count": len(prices),
+        "next_cursor": next_cursor,
+        "hours": hours,
+        "unit": "per gram",
+        "currency": "INR"
+    }, option=orjson.OPT_SERIALIZE_NUMPY)
+    return _etag_response(request, body, _etag_for(body))
+
+
+# Longer windows are downsampled to roughly PRICE_HISTORY_TARGET_POINTS buckets
+PRICE_HISTORY_RAW_HOURS = 24
+PRICE_HISTORY_TARGET_POINTS = 500
+
+
+async def _bucketed_price_history(
+    session: AsyncSession,
+    start_time: datetime,
+    hours: int
+) -> List[Dict[str, Any]]:
+    """Average price per time bucket since start_time, oldest first"""
+    bucket_seconds = max(60, -(-hours * 3600 // PRICE_HISTORY_TARGET_POINTS))
+    bucket = func.cast(func.strftime('%s', PriceData.timestamp), Integer) // bucket_seconds
+    
+    rows = (await session.execute(
+        select(
+            bucket.label("bucket"),
+            func.avg(PriceData.price),
+            func.min(func.coalesce(PriceData.low_price, PriceData.price)),
+            func.max(func.coalesce(PriceData.high_price, PriceData.price))
+        ).where(
+            PriceData.timestamp >= start_time
+        ).group_by("bucket").order_by("bucket")
+    )).all()
+    
+    return [
+        {
+            "price": round(avg_price, 2),
+            "timestamp": datetime.utcfromtimestamp(bucket_index * bucket_seconds).isoformat(),
+            "low": low,
+            "high": high
         }
-    finally:
-        session.close()
+        for bucket_index, avg_price, low, high in rows
+    ]
+
+
+# (fetched_at monotonic, rate) - the FX rate barely moves between history fetches
+_usd_inr_cache: Optional[Tuple[float, float]] = None
+USD_INR_TTL_SECONDS = 300
+
+
+def _get_usd_inr_rate(yf) -> float:
+    """USD to INR rate, refetched at most every USD_INR_TTL_SECONDS (sync)"""
+    global _usd_inr_cache
+    
+    cached = _usd_inr_cache
+    if cached is not None and time.monotonic() - cached[0] < USD_INR_TTL_SECONDS:
+        return cached[1]
+    
+    # Get USD to INR rate reliably
+    try:
+        usd_inr_ticker = yf.Ticker("USDINR=X")
+        usd_inr_hist = usd_inr_ticker.history(period="1d")
+        usd_inr_rate = usd_inr_hist["Close"].iloc[-1] if not usd_inr_hist.empty else 83.5
+        logger.info("✅ [PRICE] USD/INR rate: %s", usd_inr_rate)
+    except:
+        logger.warning("⚠️ [PRICE] Using default USD/INR rate: 83.5")
+        return 83.5  # Not cached, so the next fetch retries
+    
+    _usd_inr_cache = (time.monotonic(), usd_inr_rate)
+    return usd_inr_rate
+
+
+def _fetch_and_cache_yfinance_history(hours: int) -> List[Dict[str, Any]]:
+    """Download silver futures history, convert to INR/gram and cache it (sync)"""
+    import yfinance as yf
+    import numpy as np
+    
+    # Get silver ETF data (SLV) and convert to INR/gram
+    ticker = yf.Ticker("SI=F")  # Silver futures
+    # Use history instead of info
+    hist_period = f"{min(hours // 24 + 1, 7)}d"
+    hist = ticker.history(period=hist_period, interval="1h")
+    
+    usd_inr_rate = _get_usd_inr_rate(yf)
+    
+    # Convert: Silver is in USD/troy oz, we need INR/gram
+    INDIA_PREMIUM = 4.15
+    conversion_factor = (usd_inr_rate / 31.1035) * INDIA_PREMIUM
+    
+    if hist.empty:
+        logger.warning("⚠️ [PRICE] yfinance returned empty history")
+        raise Exception("Empty history")
+    
+    # Convert whole columns at once; tolist() hands back plain Python floats
+    ohlc = hist[["Open", "High", "Low", "Close"]].to_numpy(dtype=np.float64) * conversion_factor
+    opens, highs, lows, closes = ohlc.T.tolist()
+    r_opens, r_highs, r_lows, r_closes = np.round(ohlc, 2).T.tolist()
+    volumes = hist["Volume"].tolist()
+    
+    prices = []
+    rows = []
+    for i, timestamp in enumerate(hist.index):
+        prices.append({
+            "price": r_closes[i],
+            "timestamp": timestamp.isoformat(),
+            "open": r_opens[i],
+            "high": r_highs[i],
+            "low": r_lows[i],
+            "close": r_closes[i]
+        })
+        rows.append({
+            # SQLite DateTime drops tzinfo on write; compare the same naive value
+            "timestamp": timestamp.to_pydatetime().replace(tzinfo=None),
+            "price": closes[i],
+            "open_price": opens[i],
+            "high_price": highs[i],
+            "low_price": lows[i],
+            "close_price": closes[i],
+            "volume": volumes[i],
+            "source": "yfinance"
+        })
+    
+    # Cache in database - one executemany INSERT, skipping bars already stored
+    with session_scope() as session:
+        stored = set(session.scalars(
+            select(PriceData.timestamp).where(
+                PriceData.source == "yfinance",
+                PriceData.timestamp.between(rows[0]["timestamp"], rows[-1]["timestamp"])
+            )
+        ))
+        new_rows = [row for row in rows if row["timestamp"] not in stored]
+        if new_rows:
+            session.execute(insert(PriceData), new_rows)
+        session.commit()
+    
+    logger.info("✅ [PRICE] Cached %d price points", len(prices))
+    return prices
 
 
 @app.get("/stability")
 @app.get("/api/stability")
 async def get_stability_score():
     """Get current market stability assessment"""
-    result = stability_monitor.calculate_stability_score()
-    alert = stability_monitor.generate_alert()
+    def _assess():
+        result = stability_monitor.calculate_stability_score()
+        return result, stability_monitor.generate_alert(result)
+
+    # The 30-day price scan is sync SQLAlchemy; keep it off the event loop
+    result, alert = await asyncio.to_thread(_assess)
     
     return {
         "stability": result,
@@ -585,6 +1054,8 @@ async def discover_narratives_endpoint(
     Returns:
         Dict with discovered narratives and processing metadata
     """
+    global discovery_engine
+    
     try:
         # Import discovery engine
         from narrative.narrative_discovery import NarrativeDiscoveryEngine
@@ -596,9 +1067,10 @@ async def discover_narratives_endpoint(
         # Format for discovery
         articles = format_for_narrative_discovery(data)
         
-        # Run discovery pipeline
-        engine = NarrativeDiscoveryEngine()
-        narratives, metadata = await engine.discover_narratives(articles, top_n=top_n)
+        # Run discovery pipeline (reuse the engine so the sentence transformer loads once)
+        if discovery_engine is None:
+            discovery_engine = NarrativeDiscoveryEngine()
+        narratives, metadata = await discovery_engine.discover_narratives(articles, top_n=top_n)
         
         return {
             "success": True,
@@ -608,8 +1080,7 @@ async def discover_narratives_endpoint(
         }
     
     except Exception as e:
-        import traceback
-        traceback.print_exc()
+        logger.exception("Narrative discovery failed")
         raise HTTPException(status_code=500, detail=f"Narrative discovery failed: {str(e)}")
 
 
@@ -626,121 +1097,174 @@ async def trigger_lifecycle_tracking():
 
 
 @app.get("/api/stats")
-async def get_stats():
+async def get_stats(request: Request):
     """Get system statistics"""
-    session = get_session()
+    cache_status = "HIT" if endpoint_cache.is_fresh("stats") else "MISS"
+    body, etag = await endpoint_cache.get_or_compute(
+        "stats", lambda: _encode_json(_compute_stats())
+    )
+    return _etag_response(request, body, etag, {"X-Cache": cache_status})
+
+
+async def _compute_stats() -> Dict[str, Any]:
+    # All counts in one round trip; total and active share one narratives pass
+    narrative_counts = select(
+        func.count(Narrative.id).label("total"),
+        func.count(case((Narrative.phase != 'death', 1))).label("active")
+    ).subquery()
+    async with new_async_session() as session:
+        row = (await session.execute(
+            select(
+                narrative_counts.c.total,
+                narrative_counts.c.active,
+                select(func.count(TradingSignal.id)).scalar_subquery(),
+                select(func.count(PriceData.id)).scalar_subquery(),
+                select(func.count(SilverScan.id)).scalar_subquery()
+            )
+        )).one()
+    narrative_count, active_narratives, signal_count, price_count, scan_count = row
     
-    try:
-        narrative_count = session.query(Narrative).count()
-        active_narratives = session.query(Narrative).filter(Narrative.phase != 'death').count()
-        signal_count = session.query(TradingSignal).count()
-        price_count = session.query(PriceData).count()
-        scan_count = session.query(SilverScan).count()
-        
-        # Get orchestrator stats
-        orch_stats = orchestrator.get_stats()
-        
-        return {
-            "narratives": {
-                "total": narrative_count,
-                "active": active_narratives
-            },
-            "signals": signal_count,
-            "prices": price_count,
-            "scans": scan_count,
-            "orchestrator": orch_stats,
-            "timestamp": datetime.utcnow().isoformat()
-        }
-    finally:
-        session.close()
+    # Get orchestrator stats
+    orch_stats = orchestrator.get_stats()
+    
+    return {
+        "narratives": {
+            "total": narrative_count,
+            "active": active_narratives
+        },
+        "signals": signal_count,
+        "prices": price_count,
+        "scans": scan_count,
+        "orchestrator": orch_stats,
+        "timestamp": datetime.utcnow().isoformat()
+    }
 
 
 @app.get("/api/signals/history")
 async def get_signal_history(
     page: int = Query(default=1, ge=1, description="Page number (1-indexed)"),
-    limit: int = Query(default=10, ge=1, le=100, description="Items per page (1-100)")
+    limit: int = Query(default=10, ge=1, le=100, description="Items per page (1-100)"),
+    cursor: Optional[str] = Query(default=None, description="next_cursor from the previous page"),
+    include_total: bool = Query(default=False, description="Also compute total_count/total_pages"),
+    session: AsyncSession = Depends(get_async_session)
 ):
-    """Get trading signal history with pagination"""
-    session = get_session()
-    
-    try:
-        # Get total count
-        total_count = session.query(TradingSignal).count()
-        
-        # Apply pagination
-        offset = (page - 1) * limit
-        signals = session.query(TradingSignal).order_by(
-            TradingSignal.timestamp.desc()
-        ).offset(offset).limit(limit).all()
-        
-        # Calculate pagination metadata
+    """Get trading signal history with pagination (page offset or keyset cursor)"""
+    # Total count only on request - has_next comes from fetching one extra row
+    total_count = total_pages = None
+    if include_total:
+        total_count = await session.scalar(select(func.count(TradingSignal.id)))
         total_pages = (total_count + limit - 1) // limit
-        
-        return {
-            "signals": [s.to_dict() for s in signals],
-            "count": len(signals),
-            "pagination": {
-                "page": page,
-                "limit": limit,
-                "total_count": total_count,
-                "total_pages": total_pages,
-                "has_next": page < total_pages,
-                "has_prev": page > 1
-            }
+    
+    # Apply pagination
+    query = select(TradingSignal).order_by(
+        TradingSignal.timestamp.desc(), TradingSignal.id.desc()
+    )
+    if cursor is not None:
+        last_timestamp, last_id = _decode_cursor(cursor, datetime_key=True)
+        query = query.where(tuple_(TradingSignal.timestamp, TradingSignal.id) < (last_timestamp, last_id))
+    else:
+        query = query.offset((page - 1) * limit)
+    signals = (await session.scalars(query.limit(limit + 1))).all()
+    
+    has_next = len(signals) > limit
+    signals = signals[:limit]
+    
+    return {
+        "signals": [s.to_dict() for s in signals],
+        "count": len(signals),
+        "pagination": {
+            "page": page,
+            "limit": limit,
+            "total_count": total_count,
+            "total_pages": total_pages,
+            "has_next": has_next,
+            "has_prev": cursor is not None or page > 1,
+            "next_cursor": (
+                _encode_cursor(signals[-1].timestamp.isoformat(), signals[-1].id)
+                if has_next else None
+            )
         }
-    finally:
-        session.close()
+    }
 
 
 @app.get("/api/prices")
-async def get_prices(limit: int = 24):
+async def get_prices(
+    request: Request,
+    limit: int = Query(default=24, ge=1, le=1000, description="Most recent points (1-1000)")
+):
     """Get recent price data"""
-    session = get_session()
+    # Convert limit to int if it's a string (FastAPI should handle this, but being explicit)
+    limit_value = int(limit) if isinstance(limit, str) else limit
     
-    try:
-        # Convert limit to int if it's a string (FastAPI should handle this, but being explicit)
-        limit_value = int(limit) if isinstance(limit, str) else limit
-        
-        prices = session.query(PriceData).order_by(
-            PriceData.timestamp.desc()
-        ).limit(limit_value).all()
-        
-        return {
-            "prices": [p.to_dict() for p in prices],
-            "count": len(prices)
-        }
-    finally:
-        session.close()
+    cache_key = ("prices", limit_value)
+    cache_status = "HIT" if endpoint_cache.is_fresh(cache_key) else "MISS"
+    body, etag = await endpoint_cache.get_or_compute(
+        cache_key, lambda: _encode_json(_recent_prices(limit_value))
+    )
+    return _etag_response(request, body, etag, {"X-Cache": cache_status})
+
+
+async def _recent_prices(limit: int) -> Dict[str, Any]:
+    async with new_async_session() as session:
+        prices = (await session.scalars(
+            select(PriceData).order_by(
+                PriceData.timestamp.desc()
+            ).limit(limit)
+        )).all()
+    
+    return {
+        "prices": [p.to_dict() for p in prices],
+        "count": len(prices)
+    }
 
 
 @app.get("/api/status")
-async def get_system_status():
+async def get_system_status(request: Request):
     """Get overall system status"""
-    session = get_session()
-    
-    try:
-        # Count narratives by phase
-        narrative_counts = {}
-        for phase in ['birth', 'growth', 'peak', 'reversal', 'death']:
-            count = session.query(Narrative).filter(Narrative.phase == phase).count()
+    cache_status = "HIT" if endpoint_cache.is_fresh("status") else "MISS"
+    body, etag = await endpoint_cache.get_or_compute(
+        "status", lambda: _encode_json(_compute_system_status())
+    )
+    return _etag_response(request, body, etag, {"X-Cache": cache_status})
+
+
+async def _compute_system_status() -> Dict[str, Any]:
+    # Count narratives by phase (one GROUP BY instead of a query per phase)
+    narrative_counts = {phase: 0 for phase in ['birth', 'growth', 'peak', 'reversal', 'death']}
+    async with new_async_session() as session:
+        rows = await session.execute(
+            select(Narrative.phase, func.count(Narrative.id)).group_by(Narrative.phase)
+        )
+        for phase, count in rows:
             narrative_counts[phase] = count
-        
-        # Get orchestrator stats
-        orchestrator_stats = orchestrator.get_stats()
-        
-        # Get resource manager status
-        rm_status = resource_manager.get_status()
-        
-        return {
-            "status": "operational",
-            "narratives": narrative_counts,
-            "orchestrator": orchestrator_stats,
-            "resource_manager": rm_status,
-            "timestamp": datetime.utcnow().isoformat()
-        }
     
-    finally:
-        session.close()
+    # Get orchestrator stats
+    orchestrator_stats = orchestrator.get_stats()
+    
+    # Get resource manager status
+    rm_status = resource_manager.get_status()
+    
+    return {
+        "status": "operational",
+        "narratives": narrative_counts,
+        "orchestrator": orchestrator_stats,
+        "resource_manager": rm_status,
+        "timestamp": datetime.utcnow().isoformat()
+    }
+
+
+def handle_errors(fn):
+    """Turn unexpected handler exceptions into a logged 500; HTTPExceptions pass through"""
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        try:
+            return await fn(*args, **kwargs)
+        except HTTPException:
+            raise
+        except Exception:
+            logger.exception("❌ %s failed", fn.__name__)
+            raise HTTPException(status_code=500, detail="internal error")
+    return wrapper
 
 
 # =====================
@@ -748,36 +1272,31 @@ async def get_system_status():
 # =====================
 
 @app.post("/api/narratives/{narrative_id}/analyze-hybrid")
+@handle_errors
 async def analyze_narrative_hybrid(narrative_id: int):
     """
     Hybrid analysis combining metrics + multi-agent consensus
     Returns comprehensive analysis with both quantitative and qualitative insights
     """
-    try:
-        result = await hybrid_engine.analyze_narrative_hybrid(narrative_id)
-        return {"success": True, "data": result}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    result = await hybrid_engine.analyze_narrative_hybrid(narrative_id)
+    return {"success": True, "data": result}
 
 
 @app.post("/api/narratives/analyze-multi-agent")
+@handle_errors
 async def analyze_multi_agent(narrative_data: Dict[str, Any]):
     """
     Pure multi-agent analysis (5 specialized agents debate)
     """
-    try:
-        result = await multi_agent_orchestrator.analyze_narrative_multi(narrative_data)
-        return {"success": True, "data": result}
-    except Exception as e:
-        # Centralized error handling with stack trace for diagnostics
-        import traceback
-        traceback.print_exc()
-        raise HTTPException(status_code=500, detail=str(e))
+    result = await multi_agent_orchestrator.analyze_narrative_multi(narrative_data)
+    return {"success": True, "data": result}
 
 
 @app.post("/api/simulate")
+@handle_errors
 async def simulate_what_if(
-    request: dict
+    request: dict,
+    session: AsyncSession = Depends(get_async_session)
 ):
     """
     Run "What-If" market simulation
@@ -788,116 +1307,116 @@ async def simulate_what_if(
         "factors": ["Silver Price +5%", "Miners Strike Ends"]
     }
     """
-    try:
-        session = get_session()
-        narrative_ids = request.get("narrative_ids", [])
-        factors = request.get("factors", [])
-        
-        # Fetch active narratives
-        narratives = []
-        if narrative_ids:
-            db_narratives = session.query(Narrative).filter(Narrative.id.in_(narrative_ids)).all()
-            narratives = [n.to_dict() for n in db_narratives]
-        else:
-            # Default to top 3 active narratives
-            db_narratives = session.query(Narrative).filter(
+    narrative_ids = request.get("narrative_ids", [])
+    factors = request.get("factors", [])
+    
+    # Fetch active narratives
+    narratives = []
+    now = datetime.utcnow()
+    if narrative_ids:
+        db_narratives = (await session.scalars(
+            select(Narrative).where(Narrative.id.in_(narrative_ids))
+        )).all()
+        narratives = [n.to_dict(now) for n in db_narratives]
+    else:
+        # Default to top 3 active narratives
+        db_narratives = (await session.scalars(
+            select(Narrative).where(
                 Narrative.phase.in_(['growth', 'peak'])
-            ).order_by(Narrative.strength.desc()).limit(3).all()
-            narratives = [n.to_dict() for n in db_narratives]
-            
-        session.close()
-        
-        # Run simulation
-        result = await multi_agent_orchestrator.simulate_scenario(narratives, factors)
-        
-        return {
-            "success": True,
-            "simulation": result,
-            "inputs": {
-                "narratives_count": len(narratives),
-                "factors": factors
-            }
+            ).order_by(Narrative.strength.desc()).limit(3)
+        )).all()
+        narratives = [n.to_dict(now) for n in db_narratives]
+    
+    # Run simulation
+    result = await multi_agent_orchestrator.simulate_scenario(narratives, factors)
+    
+    return {
+        "success": True,
+        "simulation": result,
+        "inputs": {
+            "narratives_count": len(narratives),
+            "factors": factors
         }
-        
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    }
+
+
+# Hot fixed-shape queries are built once; SQLAlchemy then reuses their
+# memoized cache key and compiled SQL instead of rebuilding the statement per call
+_dominant_narrative_id_stmt = select(Narrative.id).where(
+    Narrative.phase != 'death'
+).order_by(Narrative.strength.desc()).limit(1)
 
 
 @app.get("/api/trading-signal-enhanced")
-async def get_enhanced_signal():
+async def get_enhanced_signal(session: AsyncSession = Depends(get_async_session)):
     """
     Trading signal with multi-agent debate reasoning
     """
-    session = get_session()
-    try:
-        narratives = session.query(Narrative).filter(
-            Narrative.phase != 'death'
-        ).order_by(Narrative.strength.desc()).all()
-        
-        if not narratives:
-            return {
-                "success": True,
-                "signal": {
-                    "action": "HOLD",
-                    "confidence": 0.0,
-                    "strength": 0,
-                    "reasoning": "No active narratives",
-                    "position_size": 0.0
-                }
-            }
-        
-        # Analyze top narrative with hybrid engine
-        dominant = narratives[0]
-        hybrid_analysis = await hybrid_engine.analyze_narrative_hybrid(dominant.id)
-        
-        # Generate traditional signal
-        signal = await trading_agent.generate_signal()
-        
-        # Enhance with agent insights
-        enhanced_signal = {
-            "action": signal.action,
-            "confidence": signal.confidence,
-            "strength": signal.strength,
-            "reasoning": signal.reasoning,
-            "position_size": signal.position_size,
-            "dominant_narrative": signal.dominant_narrative,
-            "price": signal.price_at_signal,
-            "conflicts": len(signal.conflicts) if signal.conflicts else 0,
-            "agent_insights": {
-                "consensus": hybrid_analysis["explanation"],
-                "votes": hybrid_analysis["agent_votes"],
-                "minority_opinions": hybrid_analysis["minority_opinions"],
-                "agent_confidence": hybrid_analysis["overall_confidence"]
-            },
-            "hybrid_analysis": {
-                "method": hybrid_analysis["analysis_method"],
-                "metrics": hybrid_analysis["metrics"]
+    dominant_id = await session.scalar(_dominant_narrative_id_stmt)
+    
+    if dominant_id is None:
+        return {
+            "success": True,
+            "signal": {
+                "action": "HOLD",
+                "confidence": 0.0,
+                "strength": 0,
+                "reasoning": "No active narratives",
+                "position_size": 0.0
             }
         }
-        
-        return {"success": True, "signal": enhanced_signal}
-    finally:
-        session.close()
+    
+    # Hybrid analysis of the top narrative and the traditional signal are
+    # independent - run them concurrently
+    hybrid_analysis, signal = await asyncio.gather(
+        hybrid_engine.analyze_narrative_hybrid(dominant_id),
+        _current_signal()
+    )
+    
+    # Enhance with agent insights
+    enhanced_signal = {
+        "action": signal.action,
+        "confidence": signal.confidence,
+        "strength": signal.strength,
+        "reasoning": signal.reasoning,
+        "position_size": signal.position_size,
+        "dominant_narrative": signal.dominant_narrative,
+        "price": signal.price_at_signal,
+        "conflicts": len(signal.conflicts) if signal.conflicts else 0,
+        "agent_insights": {
+            "consensus": hybrid_analysis["explanation"],
+            "votes": hybrid_analysis["agent_votes"],
+            "minority_opinions": hybrid_analysis["minority_opinions"],
+            "agent_confidence": hybrid_analysis["overall_confidence"]
+        },
+        "hybrid_analysis": {
+            "method": hybrid_analysis["analysis_method"],
+            "metrics": hybrid_analysis["metrics"]
+        }
+    }
+    
+    return {"success": True, "signal": enhanced_signal}
 
 
 @app.get("/api/narratives/{narrative_id}/agent-history")
-async def get_agent_history(narrative_id: int):
+async def get_agent_history(
+    narrative_id: int,
+    session: AsyncSession = Depends(get_async_session)
+):
     """
     Get historical agent votes for a narrative
     """
-    session = get_session()
-    try:
-        votes = session.query(AgentVote).filter(
+    votes = (await session.scalars(
+        select(AgentVote).where(
             AgentVote.narrative_id == narrative_id
-        ).order_by(AgentVote.timestamp.desc()).limit(50).all()
-        
-        return {
-            "narrative_id": narrative_id,
-            "vote_count": len(votes),
-            "votes": [v.to_dict() for v in votes]
-        }
-    finally:
-        session.close()
+        ).order_by(AgentVote.timestamp.desc()).limit(50)
+    )).all()
+    
+    return {
+        "narrative_id": narrative_id,
+        "vote_count": len(votes),
+        "votes": [v.to_dict() for v in votes]
+    }
 
 
 # =====================
@@ -905,7 +1424,7 @@ async def get_agent_history(narrative_id: int):
 # =====================
 
 @app.get("/api/bias/report")
-async def get_bias_report():
+async def get_bias_report(request: Request):
     """
     Get geographic bias transparency report
     
@@ -914,72 +1433,111 @@ async def get_bias_report():
     - Bias warnings
     - Adjustments applied to narratives
     """
+    cache_status = "HIT" if context_cache.is_fresh("bias_report") else "MISS"
+    body, etag = await context_cache.get_or_compute(
+        "bias_report", lambda: _encode_json(_compute_bias_report())
+    )
+    return _etag_response(request, body, etag, {
+        "X-Cache": cache_status,
+        "Cache-Control": f"public, max-age={int(context_cache.ttl_seconds)}"
+    })
+
+
+async def _compute_bias_report() -> Dict[str, Any]:
     from narrative.geo_bias_handler import geo_bias_handler
-    report = geo_bias_handler.get_transparency_report()
+    # Aggregates 30 days of articles through the sync session - keep it off the loop
+    report = await asyncio.to_thread(geo_bias_handler.get_transparency_report)
     return {"report": report, "timestamp": datetime.utcnow().isoformat()}
 
 
 @app.get("/api/bias/test")
-async def test_bias_adjustments():
+async def test_bias_adjustments(session: AsyncSession = Depends(get_async_session)):
     """
     Test geo bias adjustments on current narratives
     
     Returns before/after strength scores with explanations
     """
+    narratives = (await session.scalars(
+        select(Narrative).where(Narrative.phase != 'death')
+    )).all()
+    
+    # geo_bias_handler reads articles through the sync session - keep it off the loop
+    results = await asyncio.to_thread(_explain_bias_adjustments, narratives)
+    
+    return {
+        "narratives": results,
+        "timestamp": datetime.utcnow().isoformat()
+    }
+
+
+def _explain_bias_adjustments(narratives: List[Narrative]) -> List[Dict[str, Any]]:
+    """Before/after geo bias strength for each narrative (sync)"""
     from narrative.geo_bias_handler import geo_bias_handler
     
-    session = get_session()
-    try:
-        narratives = session.query(Narrative).filter(
-            Narrative.phase != 'death'
-        ).all()
+    # One query for every narrative's region instead of two per narrative
+    regions = geo_bias_handler.get_narrative_regions([n.id for n in narratives])
+    
+    results = []
+    for narrative in narratives:
+        # Calculate base strength (without geo bias)
+        base_strength = narrative.strength
+        region = regions[narrative.id]
         
-        results = []
-        for narrative in narratives:
-            # Calculate base strength (without geo bias)
-            base_strength = narrative.strength
-            
-            # Calculate adjusted strength
-            adjusted_strength = geo_bias_handler.calculate_adjusted_strength(
-                narrative,
-                base_strength
-            )
-            
-            # Generate explanation
-            explanation = geo_bias_handler.generate_adjustment_explanation(
-                narrative,
-                base_strength,
-                adjusted_strength
-            )
-            
-            results.append({
-                "narrative_id": narrative.id,
-                "narrative_name": narrative.name,
-                "base_strength": base_strength,
-                "adjusted_strength": adjusted_strength,
-                "adjustment_factor": adjusted_strength / base_strength if base_strength > 0 else 1.0,
-                "explanation": explanation
-            })
+        # Calculate adjusted strength
+        adjusted_strength = geo_bias_handler.calculate_adjusted_strength(
+            narrative,
+            base_strength,
+            region=region
+        )
         
-        return {
-            "narratives": results,
-            "timestamp": datetime.utcnow().isoformat()
-        }
+        # Generate explanation
+        explanation = geo_bias_handler.generate_adjustment_explanation(
+            narrative,
+            base_strength,
+            adjusted_strength,
+            region=region
+        )
+        
+        results.append({
+            "narrative_id": narrative.id,
+            "narrative_name": narrative.name,
+            "base_strength": base_strength,
+            "adjusted_strength": adjusted_strength,
+            "adjustment_factor": adjusted_strength / base_strength if base_strength > 0 else 1.0,
+            "explanation": explanation
+        })
     
-    finally:
-        session.close()
+    return results
 
 
 # =====================
 # Camera Scanning Endpoints
 # =====================
 
-# Initialize vision components
-vision_pipeline = VisionPipeline()
-valuation_engine = ValuationEngine()
+# vision_pipeline / valuation_engine are created in _load_core_modules()
 
 UPLOAD_DIR = Path("data/uploads")
 UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
+UPLOAD_CHUNK_BYTES = 1024 * 1024
+# Formats cv2.imread decodes; uploads without an extension (camera blobs) are sniffed by content
+ALLOWED_IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp"}
+
+
+def _spool_upload(src, dst: Path, max_bytes: int) -> int:
+    """
+    Copy an upload to disk in UPLOAD_CHUNK_BYTES chunks (sync)
+    
+    Stops as soon as more than max_bytes have been read; the return value
+    is then > max_bytes and the caller rejects the upload.
+    """
+    total = 0
+    with open(dst, 'wb') as out:
+        while chunk := src.read(UPLOAD_CHUNK_BYTES):
+            total += len(chunk)
+            if total > max_bytes:
+                break
+            out.write(chunk)
+    return total
 
 
 @app.post("/api/scan")
@@ -1001,24 +1559,42 @@ async def scan_silver_object(
     try:
         # Save uploaded file
         file_id = str(uuid.uuid4())
-        file_extension = Path(image.filename).suffix
+        filename = image.filename or ""
+        file_extension = "." + filename.rsplit(".", 1)[-1].lower() if "." in filename else ""
+        if file_extension and file_extension not in ALLOWED_IMAGE_EXTENSIONS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unsupported image type '{file_extension}' (use JPEG, PNG or WebP)"
+            )
         file_path = UPLOAD_DIR / f"{file_id}{file_extension}"
         
-        async with aiofiles.open(file_path, 'wb') as f:
-            content = await image.read()
-            await f.write(content)
+        # Stream to disk in 1 MB chunks so memory stays flat regardless of upload
+        # size - one worker-thread hop for the whole copy instead of one per write
+        max_bytes = config.max_upload_mb * 1024 * 1024
+        bytes_written = await asyncio.to_thread(_spool_upload, image.file, file_path, max_bytes)
         
-        # Run vision analysis
-        analysis = await vision_pipeline.analyze_image(str(file_path))
+        if bytes_written > max_bytes:
+            file_path.unlink(missing_ok=True)
+            raise HTTPException(
+                status_code=413,
+                detail=f"Image exceeds {config.max_upload_mb} MB upload limit"
+            )
         
-        # Calculate valuation
-        valuation = await valuation_engine.calculate_value(analysis)
+        # Market context doesn't depend on the image - fetch it while vision runs
+        narratives_task = asyncio.create_task(_fetch_scan_narratives())
+        
+        try:
+            # Run vision analysis
+            analysis = await vision_pipeline.analyze_image(str(file_path))
+            
+            # Calculate valuation
+            valuation = await valuation_engine.calculate_value(analysis)
+        except BaseException:
+            narratives_task.cancel()
+            raise
         
         # Get market context (active narratives)
-        session = get_session()
-        active_narratives = session.query(Narrative).filter(
-            Narrative.phase.in_(['growth', 'peak'])
-        ).order_by(Narrative.strength.desc()).limit(3).all()
+        active_narratives = await narratives_task
         
         market_context = "Current market: "
         if active_narratives:
@@ -1027,8 +1603,8 @@ async def scan_silver_object(
         else:
             market_context += "Stable conditions, no dominant narratives detected"
         
-        # Store scan in database
-        scan = SilverScan(
+        # Store scan in database - one Core INSERT, the id is already known
+        scan_row = dict(
             id=file_id,
             user_id=user_id or "anonymous",
             image_path=str(file_path),
@@ -1050,14 +1626,13 @@ async def scan_silver_object(
             }
         )
         
-        session.add(scan)
-        session.commit()
-        scan_id = scan.id
-        session.close()
+        async with new_async_session() as session:
+            await session.execute(insert(SilverScan).values(**scan_row))
+            await session.commit()
         
         # Return comprehensive result
         return {
-            "scan_id": scan_id,
+            "scan_id": file_id,
             "detected_type": analysis.detected_type,
             "purity": analysis.purity,
             "purity_confidence": analysis.purity_confidence,
@@ -1082,86 +1657,118 @@ async def scan_silver_object(
             "created_at": datetime.utcnow().isoformat()
         }
     
+    except HTTPException:
+        raise
+    
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     
     except Exception as e:
-        import traceback
-        traceback.print_exc()
+        logger.exception("Scan analysis failed")
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
 
 
+async def _fetch_scan_narratives() -> List[Narrative]:
+    """Top active narratives used as market context for a scan (shared across scans)"""
+    return await context_cache.get_or_compute(
+        ("scan_narratives", narratives_version()), _query_scan_narratives
+    )
+
+
+_scan_narratives_stmt = select(Narrative).where(
+    Narrative.phase.in_(['growth', 'peak'])
+).order_by(Narrative.strength.desc()).limit(3)
+
+
+async def _query_scan_narratives() -> List[Narrative]:
+    async with new_async_session() as session:
+        return (await session.scalars(_scan_narratives_stmt)).all()
+
+
 @app.get("/api/scans/{scan_id}")
-async def get_scan_result(scan_id: str):
+async def get_scan_result(
+    request: Request,
+    scan_id: str,
+    session: AsyncSession = Depends(get_async_session)
+):
     """Retrieve previous scan result by ID"""
-    session = get_session()
+    scan = await session.get(SilverScan, scan_id)
     
-    try:
-        scan = session.query(SilverScan).filter(SilverScan.id == scan_id).first()
-        
-        if not scan:
-            raise HTTPException(status_code=404, detail="Scan not found")
-        
-        return {
-            "scan_id": scan.id,
-            "detected_type": scan.detected_type,
-            "purity": scan.purity,
-            "weight_g": scan.estimated_weight,
-            "dimensions": scan.estimated_dimensions,
-            "valuation_range": {
-                "min": scan.valuation_min,
-                "max": scan.valuation_max,
-                "currency": "INR"
-            },
-            "confidence": scan.confidence,
-            "market_context": scan.narrative_context,
-            "created_at": scan.created_at.isoformat()
-        }
+    if not scan:
+        raise HTTPException(status_code=404, detail="Scan not found")
     
-    finally:
-        session.close()
+    body = orjson.dumps({
+        "scan_id": scan.id,
+        "detected_type": scan.detected_type,
+        "purity": scan.purity,
+        "weight_g": scan.estimated_weight,
+        "dimensions": scan.estimated_dimensions,
+        "valuation_range": {
+            "min": scan.valuation_min,
+            "max": scan.valuation_max,
+            "currency": "INR"
+        },
+        "confidence": scan.confidence,
+        "market_context": scan.narrative_context,
+        "created_at": scan.created_at.isoformat()
+    })
+    
+    # Scan results never change once written
+    return _etag_response(
+        request, body, _etag_for(body),
+        headers={"Cache-Control": "private, max-age=31536000, immutable"}
+    )
 
 
 @app.get("/api/scans/user/{user_id}")
 async def get_user_scans(
     user_id: str,
     page: int = Query(default=1, ge=1, description="Page number (1-indexed)"),
-    limit: int = Query(default=10, ge=1, le=50, description="Items per page (1-50)")
+    limit: int = Query(default=10, ge=1, le=50, description="Items per page (1-50)"),
+    cursor: Optional[str] = Query(default=None, description="next_cursor from the previous page"),
+    include_total: bool = Query(default=False, description="Also compute total_count/total_pages"),
+    session: AsyncSession = Depends(get_async_session)
 ):
-    """Get scan history for a user with pagination"""
-    session = get_session()
+    """Get scan history for a user with pagination (page offset or keyset cursor)"""
+    # Total count only on request - has_next comes from fetching one extra row
+    total_count = total_pages = None
+    if include_total:
+        total_count = await session.scalar(
+            select(func.count(SilverScan.id)).where(SilverScan.user_id == user_id)
+        )
+        total_pages = (total_count + limit - 1) // limit
     
-    try:
-        # Get total count for this user
-        total_count = session.query(SilverScan).filter(
-            SilverScan.user_id == user_id
-        ).count()
-        
-        # Apply pagination
-        offset = (page - 1) * limit
-        scans = session.query(SilverScan).filter(
-            SilverScan.user_id == user_id
-        ).order_by(SilverScan.created_at.desc()).offset(offset).limit(limit).all()
-        
-        # Calculate pagination metadata
-        total_pages = (total_count + limit - 1) // limit if total_count > 0 else 0
-        
-        return {
-            "user_id": user_id,
-            "scans": [scan.to_dict() for scan in scans],
-            "count": len(scans),
-            "pagination": {
-                "page": page,
-                "limit": limit,
-                "total_count": total_count,
-                "total_pages": total_pages,
-                "has_next": page < total_pages,
-                "has_prev": page > 1
-            }
-        }
+    # Apply pagination (seeks ix_silverscan_user_created_id)
+    query = select(SilverScan).where(
+        SilverScan.user_id == user_id
+    ).order_by(SilverScan.created_at.desc(), SilverScan.id.desc())
+    if cursor is not None:
+        last_created, last_id = _decode_cursor(cursor, datetime_key=True)
+        query = query.where(tuple_(SilverScan.created_at, SilverScan.id) < (last_created, last_id))
+    else:
+        query = query.offset((page - 1) * limit)
+    scans = (await session.scalars(query.limit(limit + 1))).all()
     
-    finally:
-        session.close()
+    has_next = len(scans) > limit
+    scans = scans[:limit]
+    
+    return {
+        "user_id": user_id,
+        "scans": [scan.to_dict() for scan in scans],
+        "count": len(scans),
+        "pagination": {
+            "page": page,
+            "limit": limit,
+            "total_count": total_count,
+            "total_pages": total_pages,
+            "has_next": has_next,
+            "has_prev": cursor is not None or page > 1,
+            "next_cursor": (
+                _encode_cursor(scans[-1].created_at.isoformat(), scans[-1].id)
+                if has_next else None
+            )
+        }
+    }
 
 
 # =====================
@@ -1171,30 +1778,150 @@ async def get_user_scans(
 class ConnectionManager:
     """Manage WebSocket connections"""
     
+    # Frames kept while the broadcaster catches up; oldest are dropped past this
+    MAX_QUEUED_BROADCASTS = 100
+    # A client that can't take a frame in this long is treated as dead
+    SEND_TIMEOUT_SECONDS = 5
+    
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        self.active_connections: Set[WebSocket] = set()
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=self.MAX_QUEUED_BROADCASTS)
     
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
-        self.active_connections.append(websocket)
-        print(f"✅ WebSocket connected (total: {len(self.active_connections)})")
+        self.active_connections.add(websocket)
+        logger.info("✅ WebSocket connected (total: %d)", len(self.active_connections))
     
     def disconnect(self, websocket: WebSocket):
-        self.active_connections.remove(websocket)
-        print(f"👋 WebSocket disconnected (total: {len(self.active_connections)})")
+        self.active_connections.discard(websocket)
+        logger.info("👋 WebSocket disconnected (total: %d)", len(self.active_connections))
     
     async def broadcast(self, message: dict):
-        """Broadcast message to all connected clients"""
-        for connection in self.active_connections:
+        """Queue message for delivery to all connected clients"""
+        if self._queue.full():
+            # Stale updates are worthless to a live dashboard - drop the oldest
+            self._queue.get_nowait()
+        self._queue.put_nowait(message)
+    
+    async def run_broadcaster(self):
+        """
+        Single consumer for queued broadcasts
+        
+        Each message is serialized once and fanned out concurrently;
+        clients whose send fails or stalls past SEND_TIMEOUT_SECONDS
+        are dropped, so one backpressured socket can't hold up the rest.
+        """
+        while True:
+            message = await self._queue.get()
+            if not self.active_connections:
+                continue
+            
             try:
-                await connection.send_json(message)
-            except:
-                pass
+                # Encode once for every client (text frame - dashboard JSON.parses it)
+                frame = orjson.dumps(message, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+                clients = list(self.active_connections)
+                results = await asyncio.gather(
+                    *(
+                        asyncio.wait_for(client.send_text(frame), self.SEND_TIMEOUT_SECONDS)
+                        for client in clients
+                    ),
+                    return_exceptions=True
+                )
+                
+                for client, result in zip(clients, results):
+                    if isinstance(result, Exception):
+                        self.disconnect(client)
+            except Exception as e:
+                # Never let one bad message kill the only consumer
+                logger.warning("⚠️  Broadcast failed: %s", e)
 
 
 manager = ConnectionManager()
 
 
+class LiveSnapshot:
+    """
+    Latest /ws/live frame, built once per tick and shared by every client
+    
+    One task queries and serializes; connections just wait for the next
+    frame, so DB work per tick no longer grows with the client count.
+    Waiters are only woken when the price or narratives actually changed.
+    """
+    
+    INTERVAL_SECONDS = 5
+    
+    _latest_price_stmt = select(PriceData).order_by(PriceData.timestamp.desc()).limit(1)
+    _top_narratives_stmt = select(Narrative).where(
+        Narrative.phase != 'death'
+    ).order_by(Narrative.strength.desc()).limit(5)
+    
+    def __init__(self):
+        self.frame: Optional[str] = None
+        # Bumped on every published frame; connections track the last one sent
+        self.version = 0
+        self._digest: Optional[bytes] = None
+        self._updated = asyncio.Event()
+    
+    async def refresh(self):
+        """Query latest price + top narratives and publish a new frame"""
+        async with new_async_session() as session:
+            # Get current price
+            latest_price = await session.scalar(self._latest_price_stmt)
+            
+            # Get active narratives
+            narratives = (await session.scalars(self._top_narratives_stmt)).all()
+        
+        now = datetime.utcnow()
+        price = latest_price.price if latest_price else None
+        narrative_dicts = [n.to_dict(now) for n in narratives]
+        
+        # Skip the push when nothing but the timestamp would differ
+        digest = hashlib.blake2b(
+            orjson.dumps([price, narrative_dicts]), digest_size=16
+        ).digest()
+        if digest == self._digest:
+            return
+        self._digest = digest
+        
+        self.frame = orjson.dumps({
+            "type": "update",
+            "price": price,
+            "narratives": narrative_dicts,
+            "timestamp": now.isoformat()
+        }).decode()
+        self.version += 1
+        
+        # Wake everyone currently waiting, then re-arm for the next tick
+        self._updated.set()
+        self._updated.clear()
+    
+    async def wait_for_frame(self, after_version: int) -> Tuple[int, str]:
+        """
+        Return (version, frame) for the first frame newer than after_version
+        
+        Returns immediately if one was published while the caller was busy
+        sending, so a slow client never sleeps through an update.
+        """
+        while self.version <= after_version:
+            await self._updated.wait()
+        return self.version, self.frame
+    
+    async def run(self):
+        """Rebuild the frame every INTERVAL_SECONDS while anyone is connected"""
+        while True:
+            await asyncio.sleep(self.INTERVAL_SECONDS)
+            if not manager.active_connections:
+                continue
+            
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.warning("⚠️  Live snapshot refresh failed: %s", e)
+
+
+live_snapshot = LiveSnapshot()
+
+
 @app.websocket("/ws/live")
 async def websocket_endpoint(websocket: WebSocket):
     """
@@ -1204,33 +1931,23 @@ async def websocket_endpoint(websocket: WebSocket):
     await manager.connect(websocket)
     
     try:
+        # Current state right away; later frames only arrive on change
+        sent_version = 0
+        if live_snapshot.frame is not None:
+            sent_version = live_snapshot.version
+            await websocket.send_text(live_snapshot.frame)
+        
         while True:
-            # Send updates every 5 seconds
-            await asyncio.sleep(5)
-            
-            # Get current price
-            session = get_session()
-            latest_price = session.query(PriceData).order_by(PriceData.timestamp.desc()).first()
-            
-            # Get active narratives
-            narratives = session.query(Narrative).filter(
-                Narrative.phase != 'death'
-            ).order_by(Narrative.strength.desc()).limit(5).all()
-            
-            # Send update
-            await websocket.send_json({
-                "type": "update",
-                "price": latest_price.price if latest_price else None,
-                "narratives": [n.to_dict() for n in narratives],
-                "timestamp": datetime.utcnow().isoformat()
-            })
-            
-            session.close()
+            # Shared frame, published by live_snapshot.run() when data changes
+            sent_version, frame = await live_snapshot.wait_for_frame(sent_version)
+            await websocket.send_text(frame)
     
     except WebSocketDisconnect:
-        manager.disconnect(websocket)
+        pass
     except Exception as e:
-        print(f"❌ WebSocket error: {e}")
+        logger.error("❌ WebSocket error: %s", e)
+    finally:
+        # Also runs when the handler is cancelled (shutdown), which skips the excepts
         manager.disconnect(websocket)
 
 
@@ -1238,51 +1955,128 @@ async def websocket_endpoint(websocket: WebSocket):
 # Background Tasks
 # =====================
 
-async def run_continuous_monitoring():
+# Background job intervals (seconds)
+DATA_REFRESH_INTERVAL_SECONDS = 300     # data source refresh
+SIGNAL_BROADCAST_INTERVAL_SECONDS = 300 # trading signal push (generating one writes a row)
+DISCOVERY_INTERVAL_SECONDS = 1800       # narrative discovery
+LIFECYCLE_INTERVAL_SECONDS = 600        # lifecycle tracking
+
+
+async def _every(
+    interval_seconds: float,
+    job: Callable[[], Awaitable[Any]],
+    name: str,
+    run_immediately: bool = True
+):
     """
-    Continuous background monitoring
-    Runs data collection, narrative discovery, and lifecycle tracking
+    Run `job` every `interval_seconds` on a fixed monotonic schedule
+    
+    The next start is computed from the previous scheduled start, not from
+    when the job finished, so runs don't drift. A run that overruns its
+    interval skips the missed slots instead of firing back-to-back.
     """
-    print("🤖 Starting continuous monitoring...")
+    next_run = time.monotonic()
+    if not run_immediately:
+        next_run += interval_seconds
     
     while True:
-        try:
-            # Every 5 minutes: check if data needs refresh
-            await resource_manager.refresh_data_sources()
-            
-            # Every 30 minutes: discover new narratives
-            if datetime.utcnow().minute % 30 == 0:
-                narratives = await pattern_hunter.discover_narratives()
-                if narratives:
-                    await pattern_hunter.save_narratives(narratives)
-            
-            # Every 10 minutes: track lifecycle
-            if datetime.utcnow().minute % 10 == 0:
-                await lifecycle_tracker.track_all_narratives()
-            
-            # Broadcast updates to WebSocket clients
-            signal = await trading_agent.generate_signal()
-            await manager.broadcast({
-                "type": "signal_update",
-                "signal": {
-                    "action": signal.action,
-                    "confidence": signal.confidence,
-                    "reasoning": signal.reasoning
-                },
-                "timestamp": datetime.utcnow().isoformat()
-            })
-            
-            await asyncio.sleep(300)  # 5 minutes
+        delay = next_run - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
         
+        try:
+            await job()
         except Exception as e:
-            print(f"❌ Background task error: {e}")
-            await asyncio.sleep(300)
+            logger.error("❌ Background job '%s' failed: %s", name, e)
+        
+        next_run += interval_seconds
+        now = time.monotonic()
+        while next_run <= now:
+            next_run += interval_seconds
+
+
+# Background writers each commit through their own sync SQLite session in a
+# worker thread; this keeps their write transactions from overlapping
+# ("database is locked") while the jobs keep independent cadences.
+_background_write_lock = asyncio.Lock()
+
+
+def _serialized(job: Callable[[], Awaitable[Any]]) -> Callable[[], Awaitable[Any]]:
+    """Wrap a background writer job so it runs under _background_write_lock"""
+    async def run():
+        async with _background_write_lock:
+            return await job()
+    return run
+
+
+async def _discover_and_save():
+    # Discovery itself is read-only (and slow); only the save takes the lock
+    narratives = await pattern_hunter.discover_narratives()
+    if narratives:
+        async with _background_write_lock:
+            await pattern_hunter.save_narratives(narratives)
+
+
+async def _broadcast_signal():
+    signal = await _current_signal()
+    await manager.broadcast({
+        "type": "signal_update",
+        "signal": {
+            "action": signal.action,
+            "confidence": signal.confidence,
+            "reasoning": signal.reasoning
+        },
+        "timestamp": datetime.utcnow().isoformat()
+    })
+
+
+async def run_continuous_monitoring():
+    """
+    Continuous background monitoring
+    Runs data collection, narrative discovery, and lifecycle tracking
+    
+    Each job runs as its own loop at its own cadence, so a slow discovery
+    pass no longer delays lifecycle tracking or the signal broadcast.
+    Cancelling this coroutine cancels every job loop.
+    """
+    logger.info("🤖 Starting continuous monitoring...")
+    
+    # First refresh completes before the jobs that read its data start
+    try:
+        await resource_manager.refresh_data_sources()
+    except Exception as e:
+        logger.error("❌ Background job 'data refresh' failed: %s", e)
+    
+    await asyncio.gather(
+        _every(DATA_REFRESH_INTERVAL_SECONDS, _serialized(resource_manager.refresh_data_sources),
+               "data refresh", run_immediately=False),
+        _every(DISCOVERY_INTERVAL_SECONDS, _discover_and_save, "narrative discovery"),
+        _every(LIFECYCLE_INTERVAL_SECONDS, _serialized(lifecycle_tracker.track_all_narratives),
+               "lifecycle tracking"),
+        _every(SIGNAL_BROADCAST_INTERVAL_SECONDS, _broadcast_signal, "signal broadcast"),
+    )
 
 
 if __name__ == "__main__":
     import uvicorn
     port = int(os.getenv("PORT", "7860"))
     log_level = os.getenv("LOG_LEVEL", "info")
-    print(f"🚀 Starting SilverSentinel via uvicorn.run on port {port}..."); sys.stdout.flush()
+    # RELOAD=true for local development; reload mode is single-process
+    reload = os.getenv("RELOAD", "false").lower() == "true"
+    workers = 1 if reload else int(os.getenv("WEB_CONCURRENCY", "1"))
+    logger.info("🚀 Starting SilverSentinel via uvicorn.run on port %d (%d worker(s))...", port, workers)
     # Host 0.0.0.0 is crucial for Hugging Face Spaces and containerized deployments
-    uvicorn.run("main:app", host="0.0.0.0", port=port, log_level=log_level)
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=port,
+        log_level=log_level,
+        # libuv event loop + C HTTP parser from uvicorn[standard] (uvloop has no Windows build)
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        ws="websockets",
+        # Protocol-level pings detect dead sockets between (change-only) pushes
+        ws_ping_interval=config.websocket_ping_interval,
+        workers=workers,
+        reload=reload
+    )
@@ -17,6 +17,30 @@ class AgentVoteResult:
     reasoning: str
 
 
+def format_evidence(evidence: List[Dict[str, Any]]) -> str:
+    """Render the evidence block shared by every agent's analysis prompt"""
+    return "\n".join([
+        f"- [{e.get('source_type', 'unknown')}] {e['text'][:200]}... (correlation: {e.get('price_impact_correlation', 0):.2f})"
+        for e in evidence[:10]
+    ])
+
+
+# Task and response format shared by every analysis prompt; _parse_response
+# relies on the PHASE/STRENGTH/CONFIDENCE/REASONING tags
+ANALYSIS_TASK_PROMPT = """**Your Task**:
+1. Determine lifecycle phase: birth, growth, peak, reversal, or death
+2. Rate strength (0-100): How impactful is this narrative right now? Consider the volume of evidence and price potential.
+3. Provide confidence (0-100): How certain are you about this analysis?
+4. Explain your reasoning briefly (2-3 sentences). Be specific about the evidence.
+
+**Response Format** (strictly follow this):
+PHASE: [phase]
+STRENGTH: [0-100]
+CONFIDENCE: [0-100]
+REASONING: [your reasoning]
+"""
+
+
 class BaseAnalyst:
     """Base class for all analysts"""
     
@@ -24,6 +48,8 @@ class BaseAnalyst:
         self.name = name
         self.specialty = specialty
         self.system_prompt = self._load_system_prompt()
+        # Full system message for analyze(); fixed per agent, so built once
+        self.analysis_system_prompt = self.system_prompt + "\n\n" + self.get_perspective_prompt()
     
     def _load_system_prompt(self) -> str:
         """Load system prompt from file"""
@@ -61,7 +87,7 @@ class BaseAnalyst:
         # Call LLM through orchestrator
         response = await orchestrator_call_llm(
             prompt=prompt,
-            system=self.system_prompt + "\n\n" + self.get_perspective_prompt(),
+            system=self.analysis_system_prompt,
             temperature=0.3
         )
         
@@ -70,10 +96,12 @@ class BaseAnalyst:
     
     def _build_analysis_prompt(self, narrative_data: Dict[str, Any]) -> str:
         """Build prompt for analysis"""
-        evidence_text = "\n".join([
-            f"- [{e['source_type']}] {e['text'][:200]}... (correlation: {e.get('price_impact_correlation', 0):.2f})"
-            for e in narrative_data.get('evidence', [])[:10]
-        ])
+        # The orchestrator pre-renders the evidence once for all agents/rounds
+        evidence_text = narrative_data.get('evidence_text')
+        if evidence_text is None:
+            evidence_text = format_evidence(narrative_data.get('evidence', []))
+        
+        debate_context = narrative_data.get('debate_context', '')
         
         return f"""Analyze this silver market narrative from your {self.specialty} perspective:
 
@@ -83,19 +111,8 @@ class BaseAnalyst:
 
 **Evidence**:
 {evidence_text or 'No evidence provided'}
-
-**Your Task**:
-1. Determine lifecycle phase: birth, growth, peak, reversal, or death
-2. Rate strength (0-100): How impactful is this narrative right now? Consider the volume of evidence and price potential.
-3. Provide confidence (0-100): How certain are you about this analysis?
-4. Explain your reasoning briefly (2-3 sentences). Be specific about the evidence.
-
-**Response Format** (strictly follow this):
-PHASE: [phase]
-STRENGTH: [0-100]
-CONFIDENCE: [0-100]
-REASONING: [your reasoning]
-"""
+{debate_context}
+{ANALYSIS_TASK_PROMPT}"""
     
     def _parse_response(self, response: str) -> AgentVoteResult:
         """Parse LLM response into AgentVoteResult"""
@@ -3,9 +3,11 @@ Multi-Agent Orchestrator
 Coordinates 5 specialized agents for consensus-based narrative analysis
 """
 import asyncio
-from typing import Dict, Any, List, Optional
+import hashlib
+import time
+from typing import Dict, Any, List, Tuple
 from datetime import datetime
-from collections import Counter
+from collections import Counter, OrderedDict
 
 from .agents import (
     FundamentalAnalyst,
@@ -13,9 +15,14 @@ from .agents import (
     TechnicalAnalyst,
     RiskAnalyst,
     MacroAnalyst,
-    AgentVoteResult
+    AgentVoteResult,
+    format_evidence
 )
 from orchestrator import orchestrator as llm_orchestrator
+from config import config
+
+# Agent LLM responses kept for config.hybrid.cache_ttl_minutes
+RESPONSE_CACHE_MAX_ENTRIES = 256
 
 
 class MultiAgentOrchestrator:
@@ -32,6 +39,8 @@ class MultiAgentOrchestrator:
             "macro": MacroAnalyst()
         }
         self.debate_history = []
+        # (system, prompt, temperature) digest -> (expires_at, response text)
+        self._response_cache: "OrderedDict[bytes, Tuple[float, str]]" = OrderedDict()
     
     async def analyze_narrative_multi(self, narrative_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -45,6 +54,12 @@ class MultiAgentOrchestrator:
         """
         print(f"🤖 Multi-agent analysis starting for: {narrative_data.get('narrative_title', 'Unknown')}")
         
+        # Evidence block is identical for every agent and both rounds
+        narrative_data = {
+            **narrative_data,
+            "evidence_text": format_evidence(narrative_data.get('evidence', []))
+        }
+        
         # Round 1: Independent analysis
         round1_votes = await self._round_1_analysis(narrative_data)
         
@@ -100,12 +115,6 @@ class MultiAgentOrchestrator:
         # Build debate context
         debate_context = self._build_debate_context(round1_votes)
         
-        # Add debate context to narrative data
-        narrative_data_with_debate = {
-            **narrative_data,
-            "previous_round_votes": debate_context
-        }
-        
         # Each agent analyzes again with knowledge of others' views
         tasks = []
         for agent_name, agent in self.agents.items():
@@ -123,7 +132,7 @@ After seeing other agents' perspectives, reconsider your analysis.
 You may change your vote if you find their arguments compelling, or defend your original position.
 """
             
-            # Add debate context to the analysis
+            # _build_analysis_prompt appends this after the evidence
             task = agent.analyze({
                 **narrative_data,
                 "debate_context": debate_prompt
@@ -173,43 +182,43 @@ You may change your vote if you find their arguments compelling, or defend your
                 "minority_opinions": []
             }
         
-        # Determine consensus phase (weighted by confidence)
+        # One pass: confidence-weighted phase totals, strength and the vote summary
         phase_weights = {}
+        total_weight = 0.0
+        strength_sum = 0.0
+        agent_votes = []
         for vote in votes:
-            phase = vote.phase_vote
-            weight = vote.confidence
-            phase_weights[phase] = phase_weights.get(phase, 0) + weight
+            phase_weights[vote.phase_vote] = phase_weights.get(vote.phase_vote, 0) + vote.confidence
+            total_weight += vote.confidence
+            strength_sum += vote.strength_vote * vote.confidence
+            agent_votes.append({
+                "agent_name": vote.agent_name,
+                "phase_vote": vote.phase_vote,
+                "strength_vote": vote.strength_vote,
+                "confidence": vote.confidence,
+                "reasoning": vote.reasoning
+            })
         
+        # Determine consensus phase (weighted by confidence)
         consensus_phase = max(phase_weights.items(), key=lambda x: x[1])[0]
         
         # Calculate weighted average strength
-        total_weight = sum(v.confidence for v in votes)
-        weighted_strength = sum(v.strength_vote * v.confidence for v in votes) / total_weight if total_weight > 0 else 50
+        weighted_strength = strength_sum / total_weight if total_weight > 0 else 50
         
         # Calculate overall confidence (average of all agents' confidence)
-        overall_confidence = sum(v.confidence for v in votes) / len(votes)
+        overall_confidence = total_weight / len(votes)
         
         # Identify minority opinions (agents who disagree with consensus)
-        minority_opinions = []
-        for vote in votes:
-            if vote.phase_vote != consensus_phase:
-                minority_opinions.append({
-                    "agent": vote.agent_name,
-                    "phase": vote.phase_vote,
-                    "strength": vote.strength_vote,
-                    "reasoning": vote.reasoning
-                })
-        
-        # Build agent votes summary
-        agent_votes = []
-        for vote in votes:
-            agent_votes.append({
-                "agent_name": vote.agent_name,
-                "phase_vote": vote.phase_vote,
-                "strength_vote": vote.strength_vote,
-                "confidence": vote.confidence,
+        minority_opinions = [
+            {
+                "agent": vote.agent_name,
+                "phase": vote.phase_vote,
+                "strength": vote.strength_vote,
                 "reasoning": vote.reasoning
-            })
+            }
+            for vote in votes
+            if vote.phase_vote != consensus_phase
+        ]
         
         return {
             "consensus_lifecycle_phase": consensus_phase,
@@ -237,18 +246,42 @@ You may change your vote if you find their arguments compelling, or defend your
         
         Returns:
             LLM response text
+        
+        Identical calls (same agent system prompt, narrative prompt and
+        temperature) within the cache TTL reuse the earlier response, so
+        repeated analyses of an unchanged narrative skip the LLM round trip.
         """
+        use_cache = config.hybrid.cache_agent_results
+        if use_cache:
+            cache_key = hashlib.blake2b(
+                f"{temperature}\x00{system}\x00{prompt}".encode(), digest_size=16
+            ).digest()
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                if cached[0] > time.monotonic():
+                    self._response_cache.move_to_end(cache_key)
+                    return cached[1]
+                self._response_cache.pop(cache_key, None)
+        
         try:
             response = await llm_orchestrator.generate_text(
                 prompt=prompt,
                 system_prompt=system,
                 temperature=temperature,
-                max_tokens=500
+                max_tokens=config.multi_agent.max_tokens_per_agent
             )
-            return response.content
         except Exception as e:
             print(f"   ⚠️ LLM call failed: {e}")
             return "ERROR: Unable to get LLM response"
+        
+        # Failures aren't cached; the next analysis retries
+        if use_cache and response.success:
+            expires_at = time.monotonic() + config.hybrid.cache_ttl_minutes * 60
+            self._response_cache[cache_key] = (expires_at, response.content)
+            if len(self._response_cache) > RESPONSE_CACHE_MAX_ENTRIES:
+                self._response_cache.popitem(last=False)  # Least recently used
+        
+        return response.content
 
 
     async def simulate_scenario(
@@ -11,6 +11,7 @@ Features:
 """
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
+from sqlalchemy import select, func
 from database import get_session, Narrative, Article
 import re
 
@@ -93,7 +94,8 @@ class GeographicBiasHandler:
     def calculate_adjusted_strength(
         self,
         narrative: Narrative,
-        base_strength: int
+        base_strength: int,
+        region: Optional[str] = None
     ) -> int:
         """
         Apply ALL geographic bias adjustments in sequence
@@ -106,6 +108,7 @@ class GeographicBiasHandler:
         Args:
             narrative: Narrative to adjust
             base_strength: Raw strength score (0-100)
+            region: Dominant region if already known (see get_narrative_regions)
         
         Returns:
             Adjusted strength (0-100)
@@ -128,7 +131,8 @@ class GeographicBiasHandler:
             self.bias_metrics["impact_type_boosts_applied"] += 1
         
         # 3. Consumer market weight (NEW)
-        region = self._get_narrative_region(narrative)
+        if region is None:
+            region = self._get_narrative_region(narrative)
         market_boost = self._calculate_market_size_boost(region)
         if market_boost > 1.0:
             strength = int(strength * market_boost)
@@ -224,15 +228,53 @@ class GeographicBiasHandler:
         finally:
             session.close()
     
+    def get_narrative_regions(self, narrative_ids: List[int]) -> Dict[int, str]:
+        """
+        Dominant region for many narratives in one query
+        
+        Same 20-articles-per-narrative sample as _get_narrative_region, but
+        fetched together (only the source column) instead of a query per
+        narrative.
+        """
+        if not narrative_ids:
+            return {}
+        
+        ranked = select(
+            Article.narrative_id,
+            Article.source,
+            func.row_number().over(
+                partition_by=Article.narrative_id, order_by=Article.id
+            ).label("rn")
+        ).where(Article.narrative_id.in_(narrative_ids)).subquery()
+        
+        sources: Dict[int, List[str]] = {narrative_id: [] for narrative_id in narrative_ids}
+        session = get_session()
+        try:
+            rows = session.execute(
+                select(ranked.c.narrative_id, ranked.c.source).where(ranked.c.rn <= 20)
+            )
+            for narrative_id, source in rows:
+                sources[narrative_id].append(source)
+        finally:
+            session.close()
+        
+        return {
+            narrative_id: self._get_dominant_region_from_sources(narrative_sources)
+            for narrative_id, narrative_sources in sources.items()
+        }
+    
     def _get_dominant_region(self, articles: List[Article]) -> str:
         """Determine dominant region from article sources"""
-        if not articles:
+        return self._get_dominant_region_from_sources([a.source for a in articles])
+    
+    def _get_dominant_region_from_sources(self, sources: List[str]) -> str:
+        if not sources:
             return "global"
         
         region_counts = {"india": 0, "us": 0, "china": 0, "global": 0}
         
-        for article in articles:
-            region = self._classify_source_region(article.source)
+        for source in sources:
+            region = self._classify_source_region(source)
             if region in region_counts:
                 region_counts[region] += 1
             else:
@@ -259,22 +301,28 @@ class GeographicBiasHandler:
         session = get_session()
         
         try:
-            # Get all recent articles (last 30 days)
+            # Recent articles (last 30 days), aggregated per (source, narrative)
+            # in SQL rather than loading every Article row
             cutoff = datetime.utcnow() - timedelta(days=30)
-            articles = session.query(Article).filter(
-                Article.published_at >= cutoff
+            rows = session.execute(
+                select(Article.source, Article.narrative_id, func.count(Article.id))
+                .where(Article.published_at >= cutoff)
+                .group_by(Article.source, Article.narrative_id)
             ).all()
             
             regional_counts = {"india": 0, "us": 0, "china": 0, "global": 0}
             regional_narratives = {"india": set(), "us": set(), "china": set(), "global": set()}
+            source_regions: Dict[str, str] = {}
             
-            for article in articles:
-                region = self._classify_source_region(article.source)
+            for source, narrative_id, count in rows:
+                region = source_regions.get(source)
+                if region is None:
+                    region = source_regions[source] = self._classify_source_region(source)
                 if region in regional_counts:
-                    regional_counts[region] += 1
+                    regional_counts[region] += count
                 
-                if article.narrative_id and region in regional_narratives:
-                    regional_narratives[region].add(article.narrative_id)
+                if narrative_id and region in regional_narratives:
+                    regional_narratives[region].add(narrative_id)
             
             total_articles = sum(regional_counts.values())
             
@@ -420,7 +468,8 @@ class GeographicBiasHandler:
         self,
         narrative: Narrative,
         base_strength: int,
-        final_strength: int
+        final_strength: int,
+        region: Optional[str] = None
     ) -> str:
         """
         Generate user-friendly explanation of adjustments
@@ -444,7 +493,8 @@ class GeographicBiasHandler:
             explanation.append(f"  • High-impact type ({impact_type}): {self.IMPACT_TYPES[impact_type]}x")
         
         # Market size
-        region = self._get_narrative_region(narrative)
+        if region is None:
+            region = self._get_narrative_region(narrative)
         market_boost = self._calculate_market_size_boost(region)
         if market_boost > 1.0:
             explanation.append(f"  • Major consumer market ({region}): {market_boost:.2f}x")
@@ -33,18 +33,27 @@ class LifecycleTracker:
         self.phase_history: Dict[int, List[Dict[str, Any]]] = {}  # Track phase changes
         self._max_history_per_narrative = 100  # Prevent memory leak
     
-    def calculate_metrics(self, narrative: Narrative) -> Dict[str, Any]:
+    def calculate_metrics(
+        self,
+        narrative: Narrative,
+        session: Optional[Session] = None,
+        velocity: Optional[Dict[str, float]] = None
+    ) -> Dict[str, Any]:
         """
         Calculate all metrics needed for phase detection
         
         Args:
             narrative: Narrative to analyze
+            session: Optional caller-owned session to reuse (left open)
+            velocity: Optional result of _calculate_velocity already computed by the caller
             
         Returns:
             Dict with velocity, correlation, sentiment metrics
         """
-        # Create a new session for this operation
-        session = get_session()
+        # Reuse the caller's session if given, otherwise open our own
+        owns_session = session is None
+        if owns_session:
+            session = get_session()
         
         try:
             # CRITICAL FIX: Use narrative.id instead of the object itself
@@ -52,7 +61,8 @@ class LifecycleTracker:
             narrative_id = narrative.id
             
             # Calculate mention velocity (mentions per hour)
-            velocity = self._calculate_velocity(narrative_id, session)
+            if velocity is None:
+                velocity = self._calculate_velocity(narrative_id, session)
             
             # Calculate price correlation
             correlation = self._calculate_price_correlation(narrative_id, session)
@@ -85,7 +95,8 @@ class LifecycleTracker:
             }
         
         finally:
-            session.close()
+            if owns_session:
+                session.close()
     
     def _calculate_velocity(
         self,
@@ -189,7 +200,7 @@ class LifecycleTracker:
         """Detect narratives conflicting with this one"""
         
         # Get the narrative first
-        narrative = session.query(Narrative).get(narrative_id)
+        narrative = session.get(Narrative, narrative_id)
         if not narrative:
             return []
         
@@ -228,19 +239,22 @@ class LifecycleTracker:
     
     def detect_phase_transition(
         self,
-        narrative: Narrative
+        narrative: Narrative,
+        metrics: Optional[Dict[str, Any]] = None
     ) -> Optional[NarrativePhase]:
         """
         Detect if narrative should transition to new phase
         
         Args:
             narrative: Narrative to check
+            metrics: Optional precomputed calculate_metrics() result
             
         Returns:
             New phase if transition should occur, None otherwise
         """
         current_phase = NarrativePhase(narrative.phase)
-        metrics = self.calculate_metrics(narrative)
+        if metrics is None:
+            metrics = self.calculate_metrics(narrative)
         
         # Birth → Growth
         if current_phase == NarrativePhase.BIRTH:
@@ -274,7 +288,7 @@ class LifecycleTracker:
             # CRITICAL FIX: Re-fetch the narrative in this session
             # This prevents "already attached to session" errors
             narrative_id = narrative.id
-            fresh_narrative = session.query(Narrative).get(narrative_id)
+            fresh_narrative = session.get(Narrative, narrative_id)
             
             if not fresh_narrative:
                 print(f"⚠️ Narrative {narrative_id} not found")
@@ -311,7 +325,11 @@ class LifecycleTracker:
         finally:
             session.close()
     
-    def calculate_narrative_strength(self, narrative: Narrative) -> int:
+    def calculate_narrative_strength(
+        self,
+        narrative: Narrative,
+        metrics: Optional[Dict[str, Any]] = None
+    ) -> int:
         """
         Calculate narrative strength score (0-100)
         
@@ -320,12 +338,17 @@ class LifecycleTracker:
         - News intensity (25%)
         - Price correlation (25%)
         - Institutional alignment (20%)
+        
+        Args:
+            narrative: Narrative to score
+            metrics: Optional precomputed calculate_metrics() result
         """
         session = get_session()
         
         try:
             narrative_id = narrative.id
-            metrics = self.calculate_metrics(narrative)
+            if metrics is None:
+                metrics = self.calculate_metrics(narrative, session=session)
             
             # Social velocity score (0-100)
             # 1 article per hour = 50 strength
@@ -373,6 +396,11 @@ class LifecycleTracker:
     
     async def track_all_narratives(self):
         """Track all active narratives and update phases"""
+        # All of the work below is sync DB access; run it in a worker thread
+        await asyncio.to_thread(self._track_all_narratives_sync)
+    
+    def _track_all_narratives_sync(self):
+        """Blocking implementation of track_all_narratives"""
         session = get_session()
         
         try:
@@ -393,7 +421,7 @@ class LifecycleTracker:
                 # Create a new session for each narrative
                 narrative_session = get_session()
                 try:
-                    narrative = narrative_session.query(Narrative).get(narrative_id)
+                    narrative = narrative_session.get(Narrative, narrative_id)
                     if not narrative:
                         continue
                     
@@ -435,11 +463,11 @@ class LifecycleTracker:
         session = get_session()
         
         try:
-            narrative = session.query(Narrative).get(narrative_id)
+            narrative = session.get(Narrative, narrative_id)
             if not narrative:
                 return {}
             
-            metrics = self.calculate_metrics(narrative)
+            metrics = self.calculate_metrics(narrative, session=session)
             sentiment_data = sentiment_analyzer.analyze_narrative_sentiment(narrative_id)
             
             age_days = (datetime.utcnow() - narrative.birth_date).days if narrative.birth_date else 0
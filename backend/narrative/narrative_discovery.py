@@ -386,14 +386,15 @@ Return ONLY the JSON array, no other text."""
         """
         Step 4: Cluster articles by semantic similarity
         """
-        # Create embeddings
-        texts = [f"{a['article'].title} {a['article'].content[:500]}" for a in articles]
-        embeddings = self.embedder.encode(texts, show_progress_bar=False)
-        
         # Cluster with HDBSCAN disabled for build speed
+        # (skip the embedding pass too - nothing consumes it until clustering is back)
         print("⚠️ HDBSCAN clustering disabled")
         return []
         
+        # Create embeddings
+        # texts = [f"{a['article'].title} {a['article'].content[:500]}" for a in articles]
+        # embeddings = self.embedder.encode(texts, show_progress_bar=False)
+        
         # min_cluster_size = max(3, len(articles) // 10)  # Dynamic based on article count
         
         # clusterer = hdbscan.HDBSCAN(
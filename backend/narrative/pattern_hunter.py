@@ -202,6 +202,10 @@ Respond with ONLY the narrative name, nothing else. Examples: "Mining Strike Con
     
     async def save_narratives(self, narratives: List[Dict[str, Any]]):
         """Save discovered narratives to database"""
+        await asyncio.to_thread(self._save_narratives_sync, narratives)
+    
+    def _save_narratives_sync(self, narratives: List[Dict[str, Any]]):
+        """Blocking implementation of save_narratives"""
         session = get_session()
         
         try:
@@ -233,7 +237,7 @@ Respond with ONLY the narrative name, nothing else. Examples: "Mining Strike Con
                     
                     # Assign articles to narrative
                     for article_id in narrative_data['article_ids']:
-                        article = session.query(Article).get(article_id)
+                        article = session.get(Article, article_id)
                         if article:
                             article.narrative_id = narrative.id
                     
@@ -104,7 +104,8 @@ class MultiModelOrchestrator:
         return await self.analyze_text(
             prompt=prompt,
             system_prompt=system_prompt,
-            model_type="general"
+            model_type="general",
+            max_tokens=max_tokens
         )
 
     async def analyze_text(
@@ -112,7 +113,8 @@ class MultiModelOrchestrator:
         prompt: str,
         system_prompt: Optional[str] = None,
         model_type: Literal["narrative", "clustering", "general"] = "general",
-        response_format: Optional[str] = None
+        response_format: Optional[str] = None,
+        max_tokens: Optional[int] = None
     ) -> ModelResponse:
         """
         Analyze text with automatic model selection and fallback
@@ -122,6 +124,7 @@ class MultiModelOrchestrator:
             system_prompt: Optional system context
             model_type: Type of task (affects model selection)
             response_format: Optional "json" for structured output
+            max_tokens: Optional cap on generated tokens (provider default if None)
         """
         start_time = time.time()
         
@@ -136,7 +139,7 @@ class MultiModelOrchestrator:
         # Try Groq first (fastest)
         if self.groq_client and self.groq_limiter.can_request():
             try:
-                response = await self._groq_text(prompt, system_prompt, groq_model, response_format)
+                response = await self._groq_text(prompt, system_prompt, groq_model, response_format, max_tokens)
                 self.groq_limiter.record_request()
                 self.stats["groq_calls"] += 1
                 return response
@@ -146,7 +149,7 @@ class MultiModelOrchestrator:
         # Fallback to Google Gemini (free tier, reliable)
         if self.gemini_available:
             try:
-                response = await self._gemini_text(prompt, system_prompt)
+                response = await self._gemini_text(prompt, system_prompt, max_tokens)
                 self.stats["gemini_calls"] += 1
                 return response
             except Exception as e:
@@ -155,7 +158,7 @@ class MultiModelOrchestrator:
         # Third fallback: Ollama (your local models - optional)
         if OLLAMA_AVAILABLE:
             try:
-                response = await self._ollama_text(prompt, system_prompt, response_format)
+                response = await self._ollama_text(prompt, system_prompt, response_format, max_tokens)
                 self.stats["ollama_calls"] += 1
                 return response
             except Exception as e:
@@ -261,7 +264,8 @@ class MultiModelOrchestrator:
         prompt: str,
         system_prompt: Optional[str],
         model: str,
-        response_format: Optional[str]
+        response_format: Optional[str],
+        max_tokens: Optional[int] = None
     ) -> ModelResponse:
         """Groq text completion"""
         start_time = time.time()
@@ -274,6 +278,8 @@ class MultiModelOrchestrator:
         kwargs = {"model": model, "messages": messages, "temperature": 0.2}
         if response_format == "json":
             kwargs["response_format"] = {"type": "json_object"}
+        if max_tokens:
+            kwargs["max_tokens"] = max_tokens
         
         response = await self.groq_client.chat.completions.create(**kwargs)
         
@@ -287,7 +293,8 @@ class MultiModelOrchestrator:
     async def _gemini_text(
         self,
         prompt: str,
-        system_prompt: Optional[str]
+        system_prompt: Optional[str],
+        max_tokens: Optional[int] = None
     ) -> ModelResponse:
         """Google Gemini text completion"""
         start_time = time.time()
@@ -296,12 +303,13 @@ class MultiModelOrchestrator:
             model = genai.GenerativeModel(config.model.text_local)
             
             full_prompt = f"{system_prompt}\n\n{prompt}" if system_prompt else prompt
+            generation_config = {"max_output_tokens": max_tokens} if max_tokens else None
             
             # Run in executor to avoid blocking
             loop = asyncio.get_event_loop()
             response = await loop.run_in_executor(
                 None,
-                lambda: model.generate_content(full_prompt)
+                lambda: model.generate_content(full_prompt, generation_config=generation_config)
             )
             
             return ModelResponse(
@@ -331,13 +339,13 @@ class MultiModelOrchestrator:
             import PIL.Image
             
             model = genai.GenerativeModel(config.model.vision_backup)
-            img = PIL.Image.open(image_path)
             
-            # Run in executor
+            # Run in executor - the image is opened/decoded there too,
+            # so no file I/O happens on the event loop
             loop = asyncio.get_event_loop()
             response = await loop.run_in_executor(
                 None,
-                lambda: model.generate_content([prompt, img])
+                lambda: model.generate_content([prompt, PIL.Image.open(image_path)])
             )
             
             return ModelResponse(
@@ -359,7 +367,8 @@ class MultiModelOrchestrator:
         self,
         prompt: str,
         system_prompt: Optional[str],
-        response_format: Optional[str]
+        response_format: Optional[str],
+        max_tokens: Optional[int] = None
     ) -> ModelResponse:
         """Ollama local text completion (for your GPT4All or other models)"""
         start_time = time.time()
@@ -373,6 +382,8 @@ class MultiModelOrchestrator:
         kwargs = {"model": "gpt-oss:20b", "messages": messages}
         if response_format == "json":
             kwargs["format"] = "json"
+        if max_tokens:
+            kwargs["options"] = {"num_predict": max_tokens}
         
         # Ollama is synchronous, run in executor
         loop = asyncio.get_event_loop()
@@ -346,11 +346,42 @@ class TestEndToEndIntegration:
             assert explanation is not None
             assert isinstance(explanation, str)
             assert len(explanation) > 0
-            
+
         finally:
             session.rollback()
             session.close()
 
+    def test_batch_regions_match_single_lookup(self, setup_database):
+        """Test get_narrative_regions agrees with the per-narrative lookup"""
+        session = get_session()
+
+        try:
+            indian = Narrative(name="Geo Batch India", phase="growth", strength=50)
+            quiet = Narrative(name="Geo Batch No Articles", phase="growth", strength=50)
+            session.add_all([indian, quiet])
+            session.flush()
+
+            for i in range(25):
+                session.add(Article(
+                    narrative_id=indian.id,
+                    title=f"Geo batch article {i}",
+                    source="economictimes" if i < 15 else "reuters",
+                    published_at=datetime.utcnow()
+                ))
+            session.commit()
+
+            regions = geo_bias_handler.get_narrative_regions([indian.id, quiet.id])
+
+            assert regions == {indian.id: "india", quiet.id: "global"}
+            assert regions[indian.id] == geo_bias_handler._get_narrative_region(indian)
+
+        finally:
+            session.rollback()
+            session.query(Article).filter(Article.title.like("Geo batch article %")).delete(synchronize_session=False)
+            session.query(Narrative).filter(Narrative.name.like("Geo Batch %")).delete(synchronize_session=False)
+            session.commit()
+            session.close()
+
 
 class TestMultipleBoostsCompounding:
     """Test multiple boosts applied together"""
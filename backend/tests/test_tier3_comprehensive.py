@@ -578,7 +578,7 @@ class Tier3TestSuite:
             
             # Refetch in new session for forecast
             session2 = get_session()
-            narrative = session2.query(Narrative).get(narrative_id)
+            narrative = session2.get(Narrative, narrative_id)
             forecast = forecaster.predict_lifecycle(narrative)
             session2.close()
             
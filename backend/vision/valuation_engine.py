@@ -133,9 +133,10 @@ class ValuationEngine:
         
         try:
             # Use XAGUSD (silver spot) as primary - price per troy ounce
+            # (.info is a blocking HTTP call, so fetch it in a thread)
             symbol = "XAGUSD=X"
             ticker = yf.Ticker(symbol)
-            info = ticker.info
+            info = await asyncio.to_thread(lambda: ticker.info)
             
             if info and 'regularMarketPrice' in info:
                 usd_price_per_oz = info.get('regularMarketPrice', 0)
@@ -147,7 +148,7 @@ class ValuationEngine:
                 # Fetch live USD/INR rate or use realistic fallback
                 try:
                     forex = yf.Ticker("INR=X")
-                    rate_info = forex.info
+                    rate_info = await asyncio.to_thread(lambda: forex.info)
                     usd_to_inr = rate_info.get('regularMarketPrice', 83.50)
                 except:
                     usd_to_inr = 83.50
@@ -103,8 +103,8 @@ class VisionPipeline:
         Returns:
             VisionAnalysisResult with all analysis data
         """
-        # Load image
-        image = cv2.imread(image_path)
+        # Load image (decode off the event loop)
+        image = await asyncio.to_thread(cv2.imread, image_path)
         if image is None:
             raise ValueError(f"Failed to load image: {image_path}")
         
@@ -173,8 +173,9 @@ class VisionPipeline:
         
         Strategy: Try traditional CV first (faster), fallback to LLM
         """
-        # Try CV-based coin detection (circles)
-        reference = self._detect_coin_cv(image)
+        # Try CV-based coin detection (circles) in a worker thread;
+        # OpenCV releases the GIL so concurrent scans overlap
+        reference = await asyncio.to_thread(self._detect_coin_cv, image)
         if reference:
             return reference
         
@@ -267,7 +268,10 @@ class VisionPipeline:
         Returns:
             (contour, mask) - largest contour and binary mask
         """
-        # Traditional CV approach
+        return await asyncio.to_thread(self._segment_silver_cv, image)
+    
+    def _segment_silver_cv(self, image: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Traditional CV segmentation (blocking)"""
         hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
         
         # Silver color range (gray/metallic)